@@ -11,16 +11,37 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import HacsBobilApiClient
-from .const import CONF_HOST, DOMAIN, LOGGER
+from .const import (
+    CONF_CAPTURE,
+    CONF_CONNECT_TIMEOUT,
+    CONF_HOST,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
+    CONF_RAW_TRANSPORT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SETTLE_TIME,
+    CONF_STATISTICS_MODE,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
+    DEFAULT_SETTLE_TIME,
+    DOMAIN,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_TIMEOUT,
+    STORAGE_VERSION,
+)
 from .coordinator import BlueprintDataUpdateCoordinator
-from .data import HacsBobilData
+from .data import HacsBobilData, HacsBobilShared
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import HacsBobilConfigEntry
 
@@ -29,8 +50,17 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.SWITCH,
     Platform.BUTTON,
+    Platform.CLIMATE,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration services."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -38,41 +68,112 @@ async def async_setup_entry(
     entry: HacsBobilConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    shared: HacsBobilShared = hass.data.setdefault(DOMAIN, HacsBobilShared())
+    shared.entries.add(entry.entry_id)
+    host = entry.data[CONF_HOST]
+    poll_floor, poll_ceiling = _poll_bounds(entry)
     coordinator = BlueprintDataUpdateCoordinator(
         hass=hass,
-        logger=LOGGER,
-        name=DOMAIN,
-        update_interval=timedelta(seconds=10),
+        poll_floor=poll_floor,
+        poll_ceiling=poll_ceiling,
     )
     entry.runtime_data = HacsBobilData(
         client=HacsBobilApiClient(
-            host=entry.data[CONF_HOST],
+            host=host,
             session=async_get_clientsession(hass),
+            scheduler=shared.scheduler(host),
+            fleet=shared.fleet,
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
-
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    _async_apply_options(entry)
+
+    # Set up from the last saved snapshot when there is one, so a van that is
+    # out of range does not hold up startup; the first live poll runs in the
+    # background.
+    try:
+        if await coordinator.async_restore():
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+            )
+        else:
+            # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+            await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        # A failed setup is not unloaded.
+        _async_release_shared(hass, entry)
+        raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Only now are all enabled entities listening.
+    coordinator.async_track_fields()
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: HacsBobilConfigEntry,
+) -> None:
+    """Remove the saved snapshot of a deleted entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: HacsBobilConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        _async_release_shared(hass, entry)
+    return unloaded
+
+
+def _async_release_shared(hass: HomeAssistant, entry: HacsBobilConfigEntry) -> None:
+    """Drop the shared state once no loaded entry uses it any more."""
+    shared: HacsBobilShared | None = hass.data.get(DOMAIN)
+    if shared is None:
+        return
+    shared.entries.discard(entry.entry_id)
+    if not shared.entries:
+        del hass.data[DOMAIN]
+
+
+def _poll_bounds(entry: HacsBobilConfigEntry) -> tuple[timedelta, timedelta]:
+    """Return the configured poll floor and ceiling."""
+    return (
+        timedelta(seconds=entry.options.get(CONF_POLL_FLOOR, DEFAULT_POLL_FLOOR)),
+        timedelta(seconds=entry.options.get(CONF_POLL_CEILING, DEFAULT_POLL_CEILING)),
+    )
 
 
-async def async_reload_entry(
-    hass: HomeAssistant,
+def _async_apply_options(entry: HacsBobilConfigEntry) -> None:
+    """Apply the entry options to the running client and coordinator."""
+    entry.runtime_data.client.set_timeouts(
+        entry.options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT),
+        entry.options.get(CONF_CONNECT_TIMEOUT, REQUEST_CONNECT_TIMEOUT),
+    )
+    entry.runtime_data.client.use_raw_transport(
+        entry.options.get(CONF_RAW_TRANSPORT, False)
+    )
+    entry.runtime_data.client.set_capture(entry.options.get(CONF_CAPTURE, False))
+    coordinator = entry.runtime_data.coordinator
+    coordinator.async_set_poll_bounds(*_poll_bounds(entry))
+    coordinator.async_set_settle_time(
+        entry.options.get(CONF_SETTLE_TIME, DEFAULT_SETTLE_TIME)
+    )
+    coordinator.async_set_statistics_mode(
+        entry.options.get(CONF_STATISTICS_MODE, False)
+    )
+
+
+async def async_update_options(
+    hass: HomeAssistant,  # noqa: ARG001
     entry: HacsBobilConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options live, without reloading the entry."""
+    _async_apply_options(entry)
+    # Poll soon so that a shorter interval takes effect straight away.
+    await entry.runtime_data.coordinator.async_request_refresh()
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
-import socket
-from datetime import UTC, datetime
-from typing import Any
+from contextlib import contextmanager
+from functools import lru_cache
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
+from yarl import URL
 
+from .breaker import HacsBobilCircuitBreaker, HacsBobilCircuitBreakerOpenError
 from .const import (
     ENDPOINT_AIR_OFF,
     ENDPOINT_AIR_ON,
@@ -19,7 +23,105 @@ from .const import (
     ENDPOINT_TEMP_UP,
     ENDPOINT_WATER_OFF,
     ENDPOINT_WATER_ON,
+    PAGE_MAX_AGE,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_READ_TIMEOUT,
+    REQUEST_TIMEOUT,
 )
+from .data import HacsBobilSnapshot
+from .fields import PAGE_FIELDS, PAGE_KEYS
+from .fleet import HacsBobilFleet
+from .scheduler import PRIORITY_COMMAND, PRIORITY_POLL, HacsBobilRequestScheduler
+from .stats import HacsBobilStats
+from .trace import PAGE_PATH, HacsBobilTrace
+from .transport import (
+    HacsBobilRawTransport,
+    HacsBobilTransportError,
+    HacsBobilTruncatedBodyError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from .fields import HacsBobilField
+    from .trace import HacsBobilReplayTransport
+
+
+def _compile_page_pattern(fields: Iterable[HacsBobilField]) -> re.Pattern[bytes]:
+    """
+    Build the single-pass pattern for the given page fields.
+
+    Each field pattern captures its value in a named group and is matched
+    right after the opening tag of its element, so one alternation regex
+    starting with a literal "<" fills every field in a single scan of the
+    page. The page is matched as bytes and only the captured values are
+    converted.
+    """
+    elements: dict[str, list[str]] = {}
+    for field in fields:
+        elements.setdefault(field.element, []).append(field.pattern)
+    return re.compile(
+        (
+            "<(?:"
+            + "|".join(
+                f"{element}>(?:{'|'.join(patterns)})"
+                for element, patterns in elements.items()
+            )
+            + ")"
+        ).encode()
+    )
+
+
+# Longest stretch of a field that can straddle two chunks
+_STREAM_OVERLAP = 64
+
+
+class _PageParser:
+    """Pattern and converters for extracting a subset of the page fields."""
+
+    __slots__ = ("converters", "keys", "pattern")
+
+    def __init__(self, keys: frozenset[str]) -> None:
+        """Initialize the parser."""
+        fields = [field for field in PAGE_FIELDS if field.key in keys]
+        self.keys = keys
+        self.pattern = _compile_page_pattern(fields)
+        self.converters: dict[str, Callable[[bytes], Any]] = {
+            field.key: field.converter for field in fields
+        }
+
+
+@lru_cache(maxsize=8)
+def _page_parser(keys: frozenset[str]) -> _PageParser:
+    """Return the parser for `keys`, shared by every client."""
+    return _PageParser(keys)
+
+
+class _PageScanner:
+    """Note which page fields have arrived while a body streams in."""
+
+    __slots__ = ("_parser", "_scanned", "end", "found")
+
+    def __init__(self, parser: _PageParser) -> None:
+        """Initialize the scanner."""
+        self._parser = parser
+        self.found: set[str] = set()
+        self.end = 0
+        self._scanned = 0
+
+    def __call__(self, buffer: bytearray, start: int, stop: int) -> int | None:
+        """
+        Scan the bytes received since the last call.
+
+        `buffer[start:stop]` is the body so far. Returns the offset just past
+        the last field once every field has been seen.
+        """
+        scan_from = max(start, self.end, self._scanned - _STREAM_OVERLAP)
+        for match in self._parser.pattern.finditer(buffer, scan_from, stop):
+            self.found.add(match.lastgroup)
+            self.end = match.end()
+        self._scanned = stop
+        return self.end if len(self.found) == len(self._parser.keys) else None
 
 
 class HacsBobilApiClientError(Exception):
@@ -35,112 +137,350 @@ class HacsBobilApiClientCommunicationError(
 class HacsBobilApiClient:
     """API Client for Van Heating System."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         host: str,
         session: aiohttp.ClientSession,
+        *,
+        streaming: bool = True,
+        raw_transport: bool = False,
+        scheduler: HacsBobilRequestScheduler | None = None,
+        fleet: HacsBobilFleet | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """
+        Initialize the API client.
+
+        With `streaming`, the page is parsed as it arrives and the connection
+        is closed as soon as every field has been seen, skipping the trailing
+        button markup. With `raw_transport`, requests bypass aiohttp and use
+        the lightweight HTTP/1.0 transport. Clients of the same host should
+        share one `scheduler`, and all clients one `fleet`; by default the
+        client gets its own.
+        """
         self._host = host
         self._session = session
         self._base_url = f"http://{host}"
-
-    async def async_get_data(self) -> dict[str, Any]:
+        self._streaming = streaming
+        self.last_poll_latency: float | None = None
+        self.last_poll_bytes: int | None = None
+        self.stats = HacsBobilStats()
+        self._parsed_body: bytes | None = None
+        self._parsed: HacsBobilSnapshot | None = None
+        self._parser = _page_parser(PAGE_KEYS)
+        self._scheduler = scheduler or HacsBobilRequestScheduler()
+        self._fleet = fleet or HacsBobilFleet()
+        url = URL(self._base_url)
+        self._address = (url.host or host, url.port or 80)
+        self._breaker = HacsBobilCircuitBreaker(*self._address)
+        self._raw: HacsBobilRawTransport | HacsBobilReplayTransport | None = None
+        self.trace: HacsBobilTrace | None = None
+        self.use_raw_transport(raw_transport)
+        self.set_timeouts(REQUEST_TIMEOUT, REQUEST_CONNECT_TIMEOUT)
+
+    def set_timeouts(self, total: float, connect: float) -> None:
+        """Change the request timeouts; applies from the next request on."""
+        self._timeout = total
+        self._connect_timeout = min(connect, total)
+        self._client_timeout = aiohttp.ClientTimeout(
+            sock_connect=self._connect_timeout,
+            sock_read=min(REQUEST_READ_TIMEOUT, total),
+        )
+
+    def use_raw_transport(self, enabled: bool) -> None:  # noqa: FBT001
+        """Switch to or from the lightweight transport for the next request."""
+        if not enabled:
+            self._raw = None
+        elif self._raw is None:
+            self._raw = HacsBobilRawTransport(*self._address)
+
+    @property
+    def fields(self) -> frozenset[str]:
+        """Return the page fields extracted from each poll."""
+        return self._parser.keys
+
+    def set_fields(self, keys: Iterable[str]) -> None:
+        """
+        Extract only the given page fields from the next poll on.
+
+        The other snapshot fields are left unset, and a streamed page is cut
+        off as soon as these fields have arrived.
+        """
+        keys = PAGE_KEYS.intersection(keys) or PAGE_KEYS
+        if keys != self._parser.keys:
+            self._parser = _page_parser(keys)
+            self._parsed_body = None
+
+    def set_capture(self, enabled: bool) -> None:  # noqa: FBT001
+        """Start or stop recording requests into `trace`."""
+        if enabled and self.trace is None:
+            self.trace = HacsBobilTrace()
+        elif not enabled:
+            self.trace = None
+
+    @contextmanager
+    def replaying(
+        self, transport: HacsBobilReplayTransport
+    ) -> Iterator[HacsBobilStats]:
+        """
+        Serve requests from a recorded trace for the duration of the block.
+
+        Requests skip the rate limit, the live circuit breaker and the shared
+        fleet slots, are not captured, and are counted in the yielded stats;
+        the live transport, stats and capture are restored afterwards.
+        """
+        live = (
+            self._raw,
+            self._scheduler,
+            self._breaker,
+            self._fleet,
+            self.stats,
+            self.trace,
+        )
+        self._raw = transport
+        self._scheduler = HacsBobilRequestScheduler(rate=float("inf"))
+        self._breaker = HacsBobilCircuitBreaker(*self._address)
+        self._fleet = HacsBobilFleet()
+        self.stats = HacsBobilStats()
+        self.trace = None
+        try:
+            yield self.stats
+        finally:
+            (
+                self._raw,
+                self._scheduler,
+                self._breaker,
+                self._fleet,
+                self.stats,
+                self.trace,
+            ) = live
+
+    @property
+    def timeout(self) -> float:
+        """Return the total timeout of a request, in seconds."""
+        return self._timeout
+
+    @property
+    def scheduler(self) -> HacsBobilRequestScheduler:
+        """Return the scheduler serializing requests to this host."""
+        return self._scheduler
+
+    @property
+    def breaker(self) -> HacsBobilCircuitBreaker:
+        """Return the circuit breaker guarding this host."""
+        return self._breaker
+
+    @property
+    def fleet(self) -> HacsBobilFleet:
+        """Return the fleet sharing poll capacity with other controllers."""
+        return self._fleet
+
+    async def async_get_data(self, max_age: float = PAGE_MAX_AGE) -> HacsBobilSnapshot:
         """Get data from the heating system by parsing HTML."""
+        body, complete = await self.async_get_page(max_age)
+        return self.parse_page(body, complete=complete)
+
+    async def async_get_page(self, max_age: float = PAGE_MAX_AGE) -> tuple[bytes, bool]:
+        """
+        Fetch the raw controller page without parsing it.
+
+        Returns the body and whether it is complete; a body that was cut off
+        after some fields had arrived is returned as far as it got. Concurrent
+        callers for the same host share one fetch, and a page fetched less
+        than `max_age` seconds ago is returned without contacting the
+        controller.
+        """
+        return await self._scheduler.async_single_flight(self._async_get_page, max_age)
+
+    async def _async_get_page(self) -> tuple[bytes, bool]:
+        """Fetch the page, mapping errors; shared by concurrent callers."""
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.get(self._base_url)
-                response.raise_for_status()
-                html = await response.text()
-
-                return self._parse_html(html)
+            await self._breaker.async_before_request()
+            body, complete = await self._scheduler.async_run(
+                PRIORITY_POLL, self._fetch_page
+            )
 
+        except HacsBobilCircuitBreakerOpenError as exception:
+            raise HacsBobilApiClientCommunicationError(
+                str(exception),
+            ) from exception
         except TimeoutError as exception:
+            self._record_failure(exception, PAGE_PATH)
             msg = f"Timeout error fetching information - {exception}"
             raise HacsBobilApiClientCommunicationError(
                 msg,
             ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
+        except (aiohttp.ClientError, HacsBobilTransportError, OSError) as exception:
+            self._record_failure(exception, PAGE_PATH)
             msg = f"Error fetching information - {exception}"
             raise HacsBobilApiClientCommunicationError(
                 msg,
             ) from exception
         except Exception as exception:
-            msg = f"Error parsing data - {exception}"
+            msg = f"Unexpected error fetching information - {exception}"
             raise HacsBobilApiClientError(
                 msg,
             ) from exception
 
-    def _parse_html(self, html: str) -> dict[str, Any]:
-        """Parse HTML to extract sensor values and statuses."""
-        data: dict[str, Any] = {}
-
-        # Extract air temperature
-        match = re.search(r"AIR TEMP:\s*([-\d.]+)&deg;C", html)
-        if match:
-            data["air_temperature"] = float(match.group(1))
-
-        # Extract air temperature target
-        match = re.search(r"AIR TEMP TARGET:\s*([-\d.]+)&deg;C", html)
-        if match:
-            data["air_temperature_target"] = float(match.group(1))
-
-        # Extract water tank temperature
-        match = re.search(r"WATER TANK TEMP:\s*([-\d.]+)&deg;C", html)
-        if match:
-            data["water_tank_temperature"] = float(match.group(1))
-
-        # Extract water level
-        match = re.search(r"WATER LEVEL:\s*([-\d.]+)%", html)
-        if match:
-            data["water_level"] = float(match.group(1))
-
-        # Extract system number
-        match = re.search(r"SYSTEM NO:\s*(\d+)", html)
-        if match:
-            data["system_number"] = match.group(1)
-
-        # Extract air heating status
-        match = re.search(r"AIR HEATING STATUS:\s*(ON|OFF)", html)
-        if match:
-            data["air_heating_status"] = match.group(1) == "ON"
-
-        # Extract water heating status
-        match = re.search(r"WATER HEATING STATUS:\s*(ON|OFF)", html)
-        if match:
-            data["water_heating_status"] = match.group(1) == "ON"
-
-        # Extract combined heating status
-        match = re.search(r"AIR AND WATER HEATING STATUS:\s*(ON|OFF)", html)
-        if match:
-            data["combined_heating_status"] = match.group(1) == "ON"
-
-        # Extract van heating status message (e.g., "HEATER COOLING")
-        match = re.search(r"<h3>(.*?)</h3>", html)
-        if match:
-            data["van_heating_status"] = match.group(1).strip()
-        else:
-            data["van_heating_status"] = None
-
-        # Add timestamp of successful fetch
-        data["last_update"] = datetime.now(UTC)
-
-        return data
+        self._record_success(PAGE_PATH, self.last_poll_latency, body)
+        return body, complete
+
+    def _record_failure(self, exception: BaseException, path: str) -> None:
+        """Note a communication error with the controller."""
+        self.stats.record_error(exception)
+        self._breaker.record_failure()
+        self._fleet.report(self._host, reachable=False)
+        if self.trace is not None:
+            self.trace.record(path, exception=exception)
+
+    def _record_success(
+        self, path: str, latency: float | None, body: bytes | None = None
+    ) -> None:
+        """Note a successful exchange with the controller."""
+        self._breaker.record_success()
+        self._fleet.report(self._host, reachable=True)
+        if self.trace is not None:
+            self.trace.record(path, latency, body)
+
+    async def _fetch_page(self) -> tuple[bytes, bool]:
+        """Fetch the controller page; runs in the host's scheduler."""
+        async with (
+            self._fleet.async_poll_slot(self._host),
+            async_timeout.timeout(self._timeout),
+        ):
+            started = monotonic()
+            if (raw := self._raw) is not None:
+                body, complete = await self._read_raw(raw)
+            else:
+                response = await self._session.get(
+                    self._base_url, timeout=self._client_timeout
+                )
+                self.stats.first_byte.record(monotonic() - started)
+                # Released on every way out, including cancellation when the
+                # scheduler preempts the poll.
+                async with response:
+                    response.raise_for_status()
+                    if self._streaming:
+                        body, complete = await self._read_until_complete(response)
+                    else:
+                        body, complete = await response.read(), True
+        self.last_poll_latency = monotonic() - started
+        self.last_poll_bytes = self.stats.response_bytes = len(body)
+        self.stats.request.record(self.last_poll_latency)
+        return body, complete
+
+    async def _read_until_complete(
+        self, response: aiohttp.ClientResponse
+    ) -> tuple[bytes, bool]:
+        """
+        Read the page until every field has been seen.
+
+        Returns the body up to the end of the last field, and whether it is
+        complete. If the body is cut off after at least one field, what was
+        received is returned as incomplete.
+        """
+        buffer = bytearray()
+        scanner = _PageScanner(self._parser)
+        try:
+            async for chunk in response.content.iter_any():
+                buffer += chunk
+                if (end := scanner(buffer, 0, len(buffer))) is not None:
+                    response.close()
+                    return bytes(buffer[:end]), True
+        except aiohttp.ClientPayloadError:
+            response.close()
+            if not scanner.found:
+                raise
+            return bytes(buffer), False
+        return bytes(buffer), True
+
+    async def _read_raw(self, raw: HacsBobilRawTransport) -> tuple[bytes, bool]:
+        """Fetch the page with the lightweight transport."""
+        scanner = _PageScanner(self._parser) if self._streaming else None
+        try:
+            body = await raw.async_get("/", self._connect_timeout, scanner)
+        except HacsBobilTruncatedBodyError as exception:
+            if scanner is None or not scanner.found:
+                raise
+            return exception.body, False
+        finally:
+            if raw.first_byte is not None:
+                self.stats.first_byte.record(raw.first_byte)
+        return body, True
+
+    def parse_page(self, body: bytes, *, complete: bool = True) -> HacsBobilSnapshot:
+        """Parse a raw controller page fetched with `async_get_page`."""
+        # Callers sharing a fetch get the same page object, parsed only once.
+        if body is self._parsed_body and self._parsed is not None:
+            return self._parsed
+        started = perf_counter()
+        try:
+            self._parsed = self._parse_html(body, cut_off=not complete)
+        except Exception as exception:
+            msg = f"Error parsing data - {exception}"
+            raise HacsBobilApiClientError(
+                msg,
+            ) from exception
+        finally:
+            self.stats.parse.record(perf_counter() - started)
+        self._parsed_body = body
+        return self._parsed
+
+    def _parse_html(self, html: bytes, *, cut_off: bool = False) -> HacsBobilSnapshot:
+        """
+        Parse HTML to extract sensor values and statuses.
+
+        When the body was `cut_off`, a value running up to the very end may be
+        incomplete and is left unset.
+        """
+        parser = self._parser
+        found: dict[str, Any] = {}
+
+        # Single pass over the page; the first occurrence of each field wins.
+        for match in parser.pattern.finditer(html):
+            key = match.lastgroup
+            if cut_off and match.end() == len(html):
+                break
+            if key not in found:
+                found[key] = parser.converters[key](match.group(key))
+                if len(found) == len(parser.keys):
+                    break
+
+        return HacsBobilSnapshot(**found)
 
     async def _send_command(self, endpoint: str) -> None:
         """Send a command to the heating system."""
+        url = f"{self._base_url}{endpoint}"
+
+        async def _request() -> None:
+            # Whatever the command does, a page fetched before it is outdated.
+            self._scheduler.invalidate()
+            async with async_timeout.timeout(self._timeout):
+                started = monotonic()
+                if (raw := self._raw) is not None:
+                    await raw.async_get(endpoint, self._connect_timeout)
+                else:
+                    async with self._session.get(
+                        url, timeout=self._client_timeout
+                    ) as response:
+                        response.raise_for_status()
+                self.stats.command.record(monotonic() - started)
+
         try:
-            async with async_timeout.timeout(10):
-                url = f"{self._base_url}{endpoint}"
-                response = await self._session.get(url)
-                response.raise_for_status()
+            await self._breaker.async_before_request()
+            await self._scheduler.async_run(PRIORITY_COMMAND, _request)
 
+        except HacsBobilCircuitBreakerOpenError as exception:
+            raise HacsBobilApiClientCommunicationError(
+                str(exception),
+            ) from exception
         except TimeoutError as exception:
+            self._record_failure(exception, endpoint)
             msg = f"Timeout error sending command - {exception}"
             raise HacsBobilApiClientCommunicationError(
                 msg,
             ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
+        except (aiohttp.ClientError, HacsBobilTransportError, OSError) as exception:
+            self._record_failure(exception, endpoint)
             msg = f"Error sending command - {exception}"
             raise HacsBobilApiClientCommunicationError(
                 msg,
@@ -151,6 +491,8 @@ class HacsBobilApiClient:
                 msg,
             ) from exception
 
+        self._record_success(endpoint, self.stats.command.last)
+
     async def async_turn_on_air_heating(self) -> None:
         """Turn on air heating."""
         await self._send_command(ENDPOINT_AIR_ON)
@@ -182,3 +524,12 @@ class HacsBobilApiClient:
     async def async_temp_down(self) -> None:
         """Decrease temperature target."""
         await self._send_command(ENDPOINT_TEMP_DOWN)
+
+    async def async_send_commands(
+        self, endpoints: Iterable[str], interval: float = 0
+    ) -> None:
+        """Send several commands back to back, `interval` seconds apart."""
+        for index, endpoint in enumerate(endpoints):
+            if index and interval:
+                await asyncio.sleep(interval)
+            await self._send_command(endpoint)
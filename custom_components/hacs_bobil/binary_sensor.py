@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -9,8 +10,10 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import Platform
 
 from .entity import HacsBobilEntity
+from .fields import PAGE_FIELDS
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -19,28 +22,17 @@ if TYPE_CHECKING:
     from .coordinator import BlueprintDataUpdateCoordinator
     from .data import HacsBobilConfigEntry
 
-ENTITY_DESCRIPTIONS = (
+ENTITY_DESCRIPTIONS = tuple(
     BinarySensorEntityDescription(
-        key="air_heating_status",
-        name="Air Heating",
-        device_class=BinarySensorDeviceClass.HEAT,
-        icon="mdi:radiator",
-        entity_registry_enabled_default=False,
-    ),
-    BinarySensorEntityDescription(
-        key="water_heating_status",
-        name="Water Heating",
-        device_class=BinarySensorDeviceClass.HEAT,
-        icon="mdi:water-boiler",
-        entity_registry_enabled_default=False,
-    ),
-    BinarySensorEntityDescription(
-        key="combined_heating_status",
-        name="Combined Heating",
-        device_class=BinarySensorDeviceClass.HEAT,
-        icon="mdi:fire",
-        entity_registry_enabled_default=False,
-    ),
+        key=field.key,
+        name=field.name,
+        icon=field.icon,
+        device_class=field.device_class
+        and BinarySensorDeviceClass(field.device_class),
+        entity_registry_enabled_default=field.enabled_default,
+    )
+    for field in PAGE_FIELDS
+    if field.platform == Platform.BINARY_SENSOR
 )
 
 
@@ -68,11 +60,12 @@ class HacsBobilBinarySensor(HacsBobilEntity, BinarySensorEntity):
         entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (entity_description.key,))
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        self._is_on = attrgetter(entity_description.key)
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
-        return self.coordinator.data.get(self.entity_description.key, False)
+        return bool(self._is_on(self.coordinator.data))
@@ -0,0 +1,102 @@
+"""Circuit breaker for unreachable controllers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+from time import monotonic
+
+import async_timeout
+
+from .const import (
+    BREAKER_BACKOFF_MAX,
+    BREAKER_BACKOFF_MIN,
+    BREAKER_PROBE_TIMEOUT,
+    BREAKER_THRESHOLD,
+    LOGGER,
+)
+
+
+class HacsBobilCircuitBreakerOpenError(Exception):
+    """Exception to indicate a request was refused by an open breaker."""
+
+
+class HacsBobilCircuitBreaker:
+    """
+    Stop waiting out timeouts on a controller that is known to be away.
+
+    After `BREAKER_THRESHOLD` consecutive communication errors the breaker
+    opens and requests fail straight away. Once the backoff has passed, a
+    cheap TCP connect with a short timeout decides whether a real request is
+    let through; each failed probe doubles the backoff, with jitter, and the
+    first success closes the breaker again. Only state changes are logged.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize the breaker."""
+        self._host = host
+        self._port = port
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._backoff = float(BREAKER_BACKOFF_MIN)
+        self._next_probe = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return true while requests fail fast."""
+        return self.opened_at is not None
+
+    async def async_before_request(self) -> None:
+        """Raise if the controller should not be contacted right now."""
+        if self.opened_at is None:
+            return
+        now = monotonic()
+        if now < self._next_probe:
+            wait = self._next_probe - now
+            msg = f"Heating system unreachable, next attempt in {wait:.0f}s"
+            raise HacsBobilCircuitBreakerOpenError(msg)
+        try:
+            async with async_timeout.timeout(BREAKER_PROBE_TIMEOUT):
+                _, writer = await asyncio.open_connection(self._host, self._port)
+        except (TimeoutError, OSError) as exception:
+            self._schedule_probe(grow=True)
+            msg = f"Heating system still unreachable - {exception}"
+            raise HacsBobilCircuitBreakerOpenError(msg) from exception
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self.opened_at is not None:
+            LOGGER.info(
+                "Heating system at %s is reachable again after %.0fs",
+                self._host,
+                monotonic() - self.opened_at,
+            )
+            self.opened_at = None
+            self._backoff = float(BREAKER_BACKOFF_MIN)
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a communication error, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.opened_at is not None:
+            # The probe connected but the request itself failed.
+            self._schedule_probe(grow=True)
+        elif self.failures >= BREAKER_THRESHOLD:
+            self.opened_at = monotonic()
+            self._schedule_probe(grow=False)
+            LOGGER.warning(
+                "Heating system at %s unreachable after %s attempts,"
+                " retrying in the background",
+                self._host,
+                self.failures,
+            )
+
+    def _schedule_probe(self, *, grow: bool) -> None:
+        """Pick the time of the next probe."""
+        if grow:
+            self._backoff = min(self._backoff * 2, BREAKER_BACKOFF_MAX)
+        self._next_probe = monotonic() + self._backoff * random.uniform(0.8, 1.2)  # noqa: S311
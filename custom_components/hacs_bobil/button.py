@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
@@ -61,9 +60,14 @@ class HacsBobilButton(HacsBobilEntity, ButtonEntity):
     async def async_press(self, **_: Any) -> None:
         """Handle the button press."""
         client = self.coordinator.config_entry.runtime_data.client
+        target = self.coordinator.data.air_temperature_target
         if self.entity_description.key == "temp_up":
-            await client.async_temp_up()
+            command = client.async_temp_up
         elif self.entity_description.key == "temp_down":
-            await client.async_temp_down()
-        await asyncio.sleep(2)
-        await self.coordinator.async_request_refresh()
+            command = client.async_temp_down
+        # At the controller's limit a press leaves the target where it is.
+        await self.coordinator.async_send_command(
+            command,
+            check=lambda data: data.air_temperature_target != target,
+            required=False,
+        )
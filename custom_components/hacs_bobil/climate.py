@@ -0,0 +1,155 @@
+"""Climate platform for hacs_bobil."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.climate import (
+    ClimateEntity,
+    ClimateEntityDescription,
+    ClimateEntityFeature,
+    HVACMode,
+)
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    ENDPOINT_TEMP_DOWN,
+    ENDPOINT_TEMP_UP,
+    LOGGER,
+    TEMP_PULSE_INTERVAL,
+    TEMP_STEP,
+)
+from .entity import HacsBobilEntity
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import BlueprintDataUpdateCoordinator
+    from .data import HacsBobilConfigEntry
+
+ENTITY_DESCRIPTIONS = (
+    ClimateEntityDescription(
+        key="heating",
+        name="Heating",
+        icon="mdi:radiator",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: HacsBobilConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the climate platform."""
+    async_add_entities(
+        HacsBobilClimate(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in ENTITY_DESCRIPTIONS
+    )
+
+
+class HacsBobilClimate(HacsBobilEntity, ClimateEntity):
+    """
+    hacs_bobil climate class.
+
+    The controller only offers temperature up/down pulses, so a new target is
+    reached by sending the required number of pulses back to back and checking
+    the result with a single poll at the end.
+    """
+
+    _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]  # noqa: RUF012
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_target_temperature_step = TEMP_STEP
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        entity_description: ClimateEntityDescription,
+    ) -> None:
+        """Initialize the climate class."""
+        super().__init__(
+            coordinator,
+            ("air_temperature", "air_temperature_target", "heating_mode"),
+        )
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the current cabin air temperature."""
+        return self.coordinator.data.air_temperature
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return the target air temperature."""
+        return self.coordinator.data.air_temperature_target
+
+    @property
+    def hvac_mode(self) -> HVACMode:
+        """Return heat when air heating is on, alone or combined."""
+        if self.coordinator.data.heating_mode in ("AIR", "BOTH"):
+            return HVACMode.HEAT
+        return HVACMode.OFF
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Turn air heating on or off."""
+        client = self.coordinator.config_entry.runtime_data.client
+        if hvac_mode == HVACMode.HEAT:
+            await self.coordinator.async_send_command(
+                client.async_turn_on_air_heating,
+                expected={"air_heating_status": True},
+            )
+            return
+        if self.coordinator.data.combined_heating_status:
+            await self.coordinator.async_send_command(
+                client.async_turn_off_combined_heating,
+                expected={"combined_heating_status": False},
+            )
+        if self.coordinator.data.air_heating_status:
+            await self.coordinator.async_send_command(
+                client.async_turn_off_air_heating,
+                expected={"air_heating_status": False},
+            )
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Move the target temperature with the fewest up/down pulses."""
+        target = kwargs[ATTR_TEMPERATURE]
+        # The second pass corrects any over- or undershoot seen in the final
+        # reading of the first one.
+        for _ in range(2):
+            current = self.target_temperature
+            if current is None:
+                msg = "Target temperature is not known yet"
+                raise HomeAssistantError(msg)
+            steps = round((target - current) / TEMP_STEP)
+            if steps == 0:
+                return
+            await self._async_send_pulses(steps)
+            await asyncio.sleep(self.coordinator.settle_time)
+            await self.coordinator.async_refresh()
+
+        final = self.target_temperature
+        if final is None or round((target - final) / TEMP_STEP) != 0:
+            msg = f"Target temperature is {final} after setting {target}"
+            raise HomeAssistantError(msg)
+
+    async def _async_send_pulses(self, steps: int) -> None:
+        """Send `steps` temperature pulses, up when positive."""
+        client = self.coordinator.config_entry.runtime_data.client
+        endpoint = ENDPOINT_TEMP_UP if steps > 0 else ENDPOINT_TEMP_DOWN
+        LOGGER.debug("Sending %s temperature pulses", steps)
+        self.coordinator.async_note_command()
+        await client.async_send_commands([endpoint] * abs(steps), TEMP_PULSE_INTERVAL)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import ipaddress
+from typing import TYPE_CHECKING
+
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from slugify import slugify
 
 from .api import (
@@ -13,7 +19,32 @@ from .api import (
     HacsBobilApiClientCommunicationError,
     HacsBobilApiClientError,
 )
-from .const import CONF_HOST, DOMAIN, LOGGER
+from .const import (
+    CONF_CAPTURE,
+    CONF_CONNECT_TIMEOUT,
+    CONF_HOST,
+    CONF_POLL_CEILING,
+    CONF_POLL_FLOOR,
+    CONF_RAW_TRANSPORT,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SETTLE_TIME,
+    CONF_STATISTICS_MODE,
+    CONF_SUBNETS,
+    DEFAULT_POLL_CEILING,
+    DEFAULT_POLL_FLOOR,
+    DEFAULT_SETTLE_TIME,
+    DISCOVERY_DEADLINE,
+    DISCOVERY_DEFAULT_NETWORK,
+    DISCOVERY_GRACE,
+    DOMAIN,
+    LOGGER,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+from .discovery import async_scan, parse_networks
+
+if TYPE_CHECKING:
+    from .data import HacsBobilShared
 
 
 class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -21,11 +52,93 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: list[str] = []
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> HacsBobilOptionsFlow:
+        """Return the options flow."""
+        return HacsBobilOptionsFlow()
+
     async def async_step_user(
         self,
-        user_input: dict | None = None,
+        user_input: dict | None = None,  # noqa: ARG002
     ) -> config_entries.ConfigFlowResult:
         """Handle a flow initialized by the user."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Scan the van's network, and any extra subnets, for the controller."""
+        _errors = {}
+        if user_input is not None:
+            try:
+                networks = [
+                    ipaddress.IPv4Network(DISCOVERY_DEFAULT_NETWORK),
+                    *parse_networks(user_input.get(CONF_SUBNETS, "")),
+                ]
+            except ValueError as exception:
+                LOGGER.debug("Invalid subnets: %s", exception)
+                _errors[CONF_SUBNETS] = "invalid_subnets"
+            else:
+                configured = self._async_current_ids()
+                self._discovered = [
+                    host
+                    for host in await self._async_discover(networks)
+                    if slugify(host) not in configured
+                ]
+                if len(self._discovered) == 1:
+                    return await self._async_create_entry(self._discovered[0])
+                if self._discovered:
+                    return await self.async_step_pick()
+                _errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SUBNETS,
+                        default=(user_input or {}).get(CONF_SUBNETS, ""),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.TEXT,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors,
+        )
+
+    async def async_step_pick(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Let the user pick one of several discovered controllers."""
+        if user_input is not None:
+            return await self._async_create_entry(user_input[CONF_HOST])
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=self._discovered),
+                    ),
+                },
+            ),
+        )
+
+    async def async_step_manual(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Handle a host entered by the user."""
         _errors = {}
         if user_input is not None:
             try:
@@ -39,17 +152,10 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exception)
                 _errors["base"] = "unknown"
             else:
-                await self.async_set_unique_id(
-                    unique_id=slugify(user_input[CONF_HOST])
-                )
-                self._abort_if_unique_id_configured()
-                return self.async_create_entry(
-                    title=user_input[CONF_HOST],
-                    data=user_input,
-                )
+                return await self._async_create_entry(user_input[CONF_HOST])
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(
@@ -65,10 +171,124 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors,
         )
 
+    async def _async_create_entry(self, host: str) -> config_entries.ConfigFlowResult:
+        """Create the entry for `host` unless it is already configured."""
+        await self.async_set_unique_id(unique_id=slugify(host))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=host, data={CONF_HOST: host})
+
+    async def _async_discover(self, networks: list[ipaddress.IPv4Network]) -> list[str]:
+        """
+        Collect the controllers found on `networks`.
+
+        Scanning stops shortly after the first match, so on the van's own
+        network the step completes in well under a second.
+        """
+        found: list[str] = []
+        loop = asyncio.get_running_loop()
+        with contextlib.suppress(TimeoutError):
+            async with (
+                asyncio.timeout(DISCOVERY_DEADLINE) as deadline,
+                contextlib.aclosing(
+                    async_scan(async_get_clientsession(self.hass), networks)
+                ) as scan,
+            ):
+                async for host in scan:
+                    found.append(host)
+                    deadline.reschedule(
+                        min(deadline.when(), loop.time() + DISCOVERY_GRACE)
+                    )
+        LOGGER.debug("Discovered %s", found)
+        return found
+
     async def _test_connection(self, host: str) -> None:
         """Validate connection to the heating system."""
+        # Queue behind the polls of an entry that already uses the host.
+        shared: HacsBobilShared | None = self.hass.data.get(DOMAIN)
         client = HacsBobilApiClient(
             host=host,
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
+            scheduler=shared.schedulers.get(host) if shared else None,
         )
         await client.async_get_data()
+
+
+def _seconds(minimum: float, maximum: float, step: float) -> selector.NumberSelector:
+    """Return a number selector for a duration in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=step,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+class HacsBobilOptionsFlow(config_entries.OptionsFlow):
+    """
+    Options flow for hacs_bobil.
+
+    Changed options are applied to the running coordinator and client by the
+    entry's update listener, so entities keep their state.
+    """
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling, timeout, settle, statistics and client options."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_POLL_FLOOR] > user_input[CONF_POLL_CEILING]:
+                _errors[CONF_POLL_CEILING] = "ceiling_below_floor"
+            elif user_input[CONF_CONNECT_TIMEOUT] > user_input[CONF_REQUEST_TIMEOUT]:
+                _errors[CONF_CONNECT_TIMEOUT] = "connect_above_request"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = {
+            CONF_POLL_FLOOR: DEFAULT_POLL_FLOOR,
+            CONF_POLL_CEILING: DEFAULT_POLL_CEILING,
+            CONF_REQUEST_TIMEOUT: REQUEST_TIMEOUT,
+            CONF_CONNECT_TIMEOUT: REQUEST_CONNECT_TIMEOUT,
+            CONF_SETTLE_TIME: DEFAULT_SETTLE_TIME,
+            CONF_STATISTICS_MODE: False,
+            CONF_RAW_TRANSPORT: False,
+            CONF_CAPTURE: False,
+            **self.config_entry.options,
+            **(user_input or {}),
+        }
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLL_FLOOR, default=options[CONF_POLL_FLOOR]
+                    ): _seconds(1, 300, 1),
+                    vol.Required(
+                        CONF_POLL_CEILING, default=options[CONF_POLL_CEILING]
+                    ): _seconds(1, 3600, 1),
+                    vol.Required(
+                        CONF_REQUEST_TIMEOUT, default=options[CONF_REQUEST_TIMEOUT]
+                    ): _seconds(1, 60, 0.5),
+                    vol.Required(
+                        CONF_CONNECT_TIMEOUT, default=options[CONF_CONNECT_TIMEOUT]
+                    ): _seconds(0.5, 30, 0.5),
+                    vol.Required(
+                        CONF_SETTLE_TIME, default=options[CONF_SETTLE_TIME]
+                    ): _seconds(0.5, 15, 0.5),
+                    vol.Required(
+                        CONF_STATISTICS_MODE, default=options[CONF_STATISTICS_MODE]
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_RAW_TRANSPORT, default=options[CONF_RAW_TRANSPORT]
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_CAPTURE, default=options[CONF_CAPTURE]
+                    ): selector.BooleanSelector(),
+                },
+            ),
+            errors=_errors,
+        )
@@ -19,3 +19,152 @@ ENDPOINT_COMBINED_ON = "/f3on"
 ENDPOINT_COMBINED_OFF = "/f3off"
 ENDPOINT_TEMP_UP = "/f4on"
 ENDPOINT_TEMP_DOWN = "/f5on"
+
+# Adaptive polling
+CONF_POLL_FLOOR = "poll_floor"
+CONF_POLL_CEILING = "poll_ceiling"
+DEFAULT_POLL_FLOOR = 5
+DEFAULT_POLL_CEILING = 120
+POLL_BACKOFF_FACTOR = 1.5
+# Seconds to keep polling at the floor after a command was sent
+POLL_COMMAND_BOOST = 60
+# Van heating status words that mean the heater is changing state
+TRANSITIONAL_HEATING_STATUSES = ("STARTING", "COOLING", "IGNITION", "PRIMING")
+# Fields whose change resets the poll interval to the floor
+POLL_RESET_FIELDS = (
+    "air_temperature_target",
+    "air_heating_status",
+    "water_heating_status",
+    "combined_heating_status",
+    "van_heating_status",
+)
+
+# Command confirmation
+# Seconds between polls while waiting for a command to show on the page
+CONFIRM_POLL_INTERVAL = 0.5
+# Initial guess of the command-to-page latency, learned per device
+CONF_SETTLE_TIME = "settle_time"
+DEFAULT_SETTLE_TIME = 2.0
+# The confirmation budget is the learned latency times this margin, clamped
+SETTLE_MARGIN = 3
+SETTLE_MIN = 1.0
+SETTLE_MAX = 15.0
+
+# Target temperature
+# Degrees the target moves per temperature up/down pulse
+TEMP_STEP = 1.0
+# Seconds between back-to-back temperature pulses
+TEMP_PULSE_INTERVAL = 0.3
+
+# Request scheduling
+# Sustained requests per second to one controller, and the allowed burst
+REQUEST_RATE = 4.0
+REQUEST_BURST = 4
+
+# Fleet scheduling
+# Polls in flight across all controllers, and how many of them may go to
+# controllers whose last poll failed
+FLEET_MAX_CONCURRENT_POLLS = 4
+FLEET_MAX_UNREACHABLE_POLLS = 1
+# Relative random spread applied to every poll interval
+POLL_JITTER = 0.2
+
+# Persisted snapshot
+STORAGE_VERSION = 1
+# Seconds between writes of the last known snapshot
+STORAGE_SAVE_DELAY = 300
+ATTR_STALE = "stale"
+
+# Seconds a fetched page is shared with later callers before it is refetched
+PAGE_MAX_AGE = 1.0
+
+# Timeouts, in seconds
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+REQUEST_TIMEOUT = 10
+REQUEST_CONNECT_TIMEOUT = 3
+REQUEST_READ_TIMEOUT = 5
+
+# Lightweight HTTP client
+CONF_RAW_TRANSPORT = "raw_transport"
+# Starting size of the receive buffer, which grows to fit larger pages
+RAW_BUFFER_SIZE = 4096
+# Bytes of response headers accepted before giving up
+RAW_MAX_HEAD = 8192
+
+# Traffic capture and replay
+CONF_CAPTURE = "capture"
+# Requests kept in the capture ring buffer
+TRACE_SIZE = 300
+
+# Circuit breaker
+# Consecutive communication errors before requests fail fast
+BREAKER_THRESHOLD = 3
+# Seconds before the first probe of an unreachable controller, doubling after
+# every failed probe up to the maximum
+BREAKER_BACKOFF_MIN = 15
+BREAKER_BACKOFF_MAX = 600
+BREAKER_PROBE_TIMEOUT = 2
+
+# History
+# Samples kept per field, and the age in seconds after which samples drop out
+HISTORY_SIZE = 360
+HISTORY_WINDOW = 900
+# Seconds the samples must span before a rate of change is reported
+HISTORY_MIN_SPAN = 60
+ATTR_WINDOW_MIN = "window_min"
+ATTR_WINDOW_MAX = "window_max"
+
+# Sensor write filtering
+# Smallest change of a reading that is written straight away
+TEMPERATURE_DEADBAND = 0.1
+WATER_LEVEL_DEADBAND = 0.5
+# Seconds between writes of readings, of the last update timestamp and of
+# trend sensors
+SENSOR_MIN_INTERVAL = 30
+LAST_UPDATE_MIN_INTERVAL = 300
+TREND_MIN_INTERVAL = 60
+# Seconds after which a held-back value is written regardless
+SENSOR_HEARTBEAT = 900
+
+# Heater runtime accounting
+# Seconds covered by the rolling duty cycle, and the buckets it is kept in
+RUNTIME_WINDOW = 3600
+RUNTIME_BUCKETS = 12
+# Seconds between state writes of the runtime sensors
+RUNTIME_MIN_INTERVAL = 60
+# Listener context of entities showing the runtime counters, which move on
+# every poll even when the snapshot does not change
+RUNTIME_CONTEXT = "runtime"
+
+# Services
+SERVICE_APPLY_STATE = "apply_state"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_AIR_HEATING = "air_heating"
+ATTR_WATER_HEATING = "water_heating"
+ATTR_COMBINED_HEATING = "combined_heating"
+SERVICE_REPLAY = "replay"
+ATTR_FILE = "file"
+ATTR_SPEED = "speed"
+
+# Discovery
+# Subnet the controller's own access point hands out
+DISCOVERY_DEFAULT_NETWORK = "192.168.4.0/24"
+# Probes in flight at once, and the largest scan accepted
+DISCOVERY_WORKERS = 128
+DISCOVERY_MAX_HOSTS = 1024
+# Seconds to connect to and to fully probe one host
+DISCOVERY_CONNECT_TIMEOUT = 0.5
+DISCOVERY_TIMEOUT = 1.5
+# Seconds to keep scanning after the first match, and in total
+DISCOVERY_GRACE = 0.5
+DISCOVERY_DEADLINE = 5.0
+# Bytes of a page that must contain every marker of the controller page
+DISCOVERY_READ_LIMIT = 4096
+DISCOVERY_SIGNATURE = (b"BOBIL VANS", b"SYSTEM NO:")
+CONF_SUBNETS = "subnets"
+
+# Statistics mode
+CONF_STATISTICS_MODE = "statistics_mode"
+# Seconds per in-memory aggregation bucket
+STATISTICS_PERIOD = 300
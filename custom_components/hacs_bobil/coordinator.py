@@ -2,43 +2,653 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import random
+from time import monotonic, perf_counter
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     HacsBobilApiClientCommunicationError,
     HacsBobilApiClientError,
 )
-from .const import LOGGER
+from .const import (
+    CONFIRM_POLL_INTERVAL,
+    DEFAULT_SETTLE_TIME,
+    DOMAIN,
+    ENDPOINT_TEMP_DOWN,
+    ENDPOINT_TEMP_UP,
+    LOGGER,
+    PAGE_MAX_AGE,
+    POLL_BACKOFF_FACTOR,
+    POLL_COMMAND_BOOST,
+    POLL_JITTER,
+    POLL_RESET_FIELDS,
+    RUNTIME_CONTEXT,
+    SETTLE_MARGIN,
+    SETTLE_MAX,
+    SETTLE_MIN,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TEMP_PULSE_INTERVAL,
+    TEMP_STEP,
+    TRANSITIONAL_HEATING_STATUSES,
+)
+from .data import HacsBobilSnapshot
+from .fields import (
+    HISTORY_FIELDS,
+    PAGE_KEYS,
+    RUNTIME_FIELDS,
+    STATISTICS_FIELDS,
+    STATUS_ENDPOINTS,
+    page_keys,
+)
+from .history import HacsBobilHistory
+from .runtime import HacsBobilRuntime
+from .statistics import HacsBobilStatistics
+from .trace import PAGE_PATH, HacsBobilReplayTransport
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime, timedelta
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
     from .data import HacsBobilConfigEntry
+    from .trace import HacsBobilTraceEvent
+
+
+def plan_commands(
+    current: HacsBobilSnapshot,
+    statuses: dict[str, bool],
+    temperature: float | None = None,
+) -> list[str]:
+    """
+    Return the shortest endpoint sequence taking `current` to the desired state.
+
+    Only statuses that differ from the current snapshot are switched, modes
+    are turned off before others are turned on so the controller never has to
+    arbitrate between two heating modes, and the target temperature is moved
+    last with the fewest up or down pulses.
+    """
+    switches = [
+        (on, STATUS_ENDPOINTS[key][0 if on else 1])
+        for key, on in statuses.items()
+        if getattr(current, key) != on
+    ]
+    plan = [endpoint for on, endpoint in switches if not on]
+    plan += [endpoint for on, endpoint in switches if on]
+    if temperature is not None:
+        if current.air_temperature_target is None:
+            msg = "Target temperature is not known yet"
+            raise HomeAssistantError(msg)
+        steps = round((temperature - current.air_temperature_target) / TEMP_STEP)
+        plan += [ENDPOINT_TEMP_UP if steps > 0 else ENDPOINT_TEMP_DOWN] * abs(steps)
+    return plan
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class BlueprintDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+class BlueprintDataUpdateCoordinator(DataUpdateCoordinator[HacsBobilSnapshot]):
+    """
+    Class to manage fetching data from the API.
+
+    Most polls return a byte-identical page, so the raw body is hashed and the
+    previous snapshot is returned unchanged when the hash matches. Together
+    with `always_update=False` this means listeners are only called when a
+    field actually changes; `last_contact` records every successful poll.
+
+    The poll interval adapts to heater activity: it stays at `poll_floor`
+    while a heater is on, the heater is changing state or a command was just
+    sent, and backs off towards `poll_ceiling` while nothing changes. Every
+    interval is jittered, and the first one is staggered, so that many vans
+    set up together do not keep polling in lockstep.
+
+    Commands go through `async_send_command`, which shows the expected state
+    straight away and then polls until the page confirms it, learning how long
+    the controller takes to reflect a command.
+
+    The last good snapshot is saved to storage, at most every few minutes, so
+    that after a restart entities can be set up from it straight away while
+    the van is out of reach. Until the first live poll succeeds such restored
+    data is flagged as `stale`.
+
+    Every successful poll adds the numeric readings to a rolling in-memory
+    `history`, from which rates of change and time estimates are derived, and,
+    in statistics mode, to the hourly long-term `statistics`. The heating
+    statuses drive the on-time and cycle counters in `runtime`, which are
+    saved along with the snapshot while a heater is on.
+
+    The client only extracts the page fields that the registered listeners
+    show, plus those the coordinator needs itself, and is told again whenever
+    a listener is added or removed, i.e. an entity is enabled or disabled.
+
+    A trace captured by the client can be fed back through the coordinator
+    and the entities with `async_replay`, to profile them without the van.
+    """
 
     config_entry: HacsBobilConfigEntry
-    _last_successful_data: dict[str, Any] | None = None
+    _last_successful_data: HacsBobilSnapshot | None = None
+    _last_fields: HacsBobilSnapshot | None = None
+    _last_digest: bytes | None = None
+    last_contact: datetime | None = None
+    stale = False
+    _communication_failing = False
+    _notified_data: HacsBobilSnapshot | None = None
+    _notified_state: tuple[bool, bool] | None = None
+    statistics: HacsBobilStatistics | None = None
+    _replaying = False
+    _tracking_fields = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        poll_floor: timedelta,
+        poll_ceiling: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass=hass,
+            logger=LOGGER,
+            name=DOMAIN,
+            update_interval=poll_floor * (1 + random.random()),  # noqa: S311
+            always_update=False,
+        )
+        self.poll_floor = poll_floor
+        self.poll_ceiling = poll_ceiling
+        self._base_interval = poll_floor
+        self._boost_until = 0.0
+        self.settle_time = self._configured_settle_time = DEFAULT_SETTLE_TIME
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{self.config_entry.entry_id}"
+        )
+        self._save_pending = False
+        self.history = HacsBobilHistory(HISTORY_FIELDS)
+        self.runtime = HacsBobilRuntime()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates and extract the fields the listener shows."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._async_update_fields()
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            self._async_update_fields()
+
+        return remove
+
+    @callback
+    def async_track_fields(self) -> None:
+        """Start narrowing the extracted fields; call once the entities are set up."""
+        self._tracking_fields = True
+        self._async_update_fields()
+
+    @callback
+    def _async_update_fields(self) -> None:
+        """
+        Have the client extract only the page fields that are needed.
+
+        Those are the fields in the listener contexts, the fields polling and
+        the runtime counters depend on and, in statistics mode, the aggregated
+        readings. A listener without a context needs every field. When fields
+        are added, the page is parsed again on a refresh requested right away.
+        """
+        if not self._tracking_fields:
+            return
+        contexts = [context for _, context in self._listeners.values()]
+        if None in contexts:
+            keys = PAGE_KEYS
+        else:
+            keys = page_keys(
+                set(POLL_RESET_FIELDS).union(
+                    RUNTIME_FIELDS,
+                    *contexts,
+                    STATISTICS_FIELDS if self.statistics is not None else (),
+                )
+            )
+        client = self.config_entry.runtime_data.client
+        extracted = client.fields
+        client.set_fields(keys)
+        if client.fields <= extracted:
+            return
+        self._last_digest = None
+        if self._listeners:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN} field refresh"
+            )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update only the listeners whose fields changed.
+
+        Entities register the snapshot fields they show as their listener
+        context. Every listener is still called when availability or the
+        stale flag changes, since those affect all entities. The time taken,
+        including the entities' state writes, is recorded in the stats.
+        """
+        started = perf_counter()
+        self._async_dispatch_update()
+        self.config_entry.runtime_data.client.stats.listeners.record(
+            perf_counter() - started
+        )
+
+    @callback
+    def _async_dispatch_update(self) -> None:
+        """Call the listeners affected by the latest update."""
+        data = self.data
+        state = (self.last_update_success, self.stale)
+        previous, self._notified_data = self._notified_data, data
+        previous_state, self._notified_state = self._notified_state, state
+        if data is None or previous is None or state != previous_state:
+            super().async_update_listeners()
+            return
+        if not (changed := data.changed_fields(previous)):
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def async_restore(self) -> bool:
+        """Load the last saved snapshot as stale data; return whether there was one."""
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        self._last_fields = HacsBobilSnapshot.from_dict(stored["fields"])
+        self._last_successful_data = self.data = dataclasses.replace(
+            self._last_fields,
+            last_update=dt_util.parse_datetime(stored["last_update"]),
+        )
+        if "runtime" in stored:
+            self.runtime.load(stored["runtime"])
+        self.stale = True
+        return True
+
+    def _async_schedule_save(self) -> None:
+        """Save the current snapshot soon, unless a save is already pending."""
+        if not self._save_pending and not self._replaying:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the snapshot to save."""
+        self._save_pending = False
+        return {
+            "fields": self._last_fields.as_dict(),
+            "last_update": self._last_successful_data.last_update.isoformat(),
+            "runtime": self.runtime.as_dict(),
+        }
+
+    @callback
+    def async_set_poll_bounds(self, floor: timedelta, ceiling: timedelta) -> None:
+        """Change the poll interval bounds of the running coordinator."""
+        self.poll_floor = floor
+        self.poll_ceiling = ceiling
+        self._base_interval = min(max(self._base_interval, floor), ceiling)
+        if not floor <= self.update_interval <= ceiling:
+            self.update_interval = self._base_interval
+
+    @callback
+    def async_set_statistics_mode(self, enabled: bool) -> None:  # noqa: FBT001
+        """Start or stop aggregating readings into long-term statistics."""
+        if enabled and self.statistics is None:
+            self.statistics = HacsBobilStatistics(self.hass, self.config_entry)
+        elif not enabled:
+            self.statistics = None
+        self._async_update_fields()
+
+    @callback
+    def async_set_settle_time(self, settle_time: float) -> None:
+        """Restart the settle estimate from `settle_time` if the setting changed."""
+        if settle_time != self._configured_settle_time:
+            self._configured_settle_time = self.settle_time = settle_time
+
+    def async_note_command(self) -> None:
+        """
+        Poll at the floor interval for a while after a command was sent.
+
+        Called before sending; raises HomeAssistantError while a trace is
+        replayed, as the command would not reach the controller.
+        """
+        self._raise_if_replaying()
+        self._boost_until = monotonic() + POLL_COMMAND_BOOST
+        self._base_interval = self.update_interval = self.poll_floor
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+    async def async_send_command(
+        self,
+        command: Callable[[], Awaitable[None]],
+        *,
+        expected: dict[str, Any] | None = None,
+        check: Callable[[HacsBobilSnapshot], bool] | None = None,
+        required: bool = True,
+    ) -> None:
+        """
+        Send a command and wait until the controller page reflects it.
+
+        `expected` fields are applied optimistically and, unless `check` is
+        given, are also what the page has to show. If the change does not show
+        up within the learned settle budget the real state is restored and,
+        unless the command may legitimately change nothing (`required` is
+        false), HomeAssistantError is raised. It is always raised when the
+        controller could not be reached by the end of the budget.
+        """
+        self._raise_if_replaying()
+        if check is None:
+            expected_items = (expected or {}).items()
+
+            def check(data: HacsBobilSnapshot) -> bool:
+                return all(getattr(data, key) == value for key, value in expected_items)
+
+        previous = self.data
+        await command()
+        sent = monotonic()
+        self.async_note_command()
+        if expected and previous is not None:
+            self.async_set_updated_data(dataclasses.replace(previous, **expected))
+
+        budget = min(max(self.settle_time * SETTLE_MARGIN, SETTLE_MIN), SETTLE_MAX)
+        while True:
+            await asyncio.sleep(CONFIRM_POLL_INTERVAL)
+            contact = self.last_contact
+            try:
+                # Every confirmation poll must ask the controller; a shared
+                # page would delay the confirmation and skew the settle time.
+                data = await self._async_update_data(max_age=0)
+            except UpdateFailed as exception:
+                LOGGER.debug("Poll while confirming command failed: %s", exception)
+                data = None
+            if self.last_contact is contact:
+                # Unreachable; what came back is the last known state.
+                data = None
+            if data is not None and check(data):
+                self._learn_settle_time(monotonic() - sent)
+                self.async_set_updated_data(data)
+                return
+            if monotonic() - sent >= budget:
+                break
+
+        # Roll back to what the controller actually reports.
+        if (actual := data if data is not None else previous) is not None:
+            self.async_set_updated_data(actual)
+        if not required and data is not None:
+            LOGGER.debug("Command changed nothing within %.1fs", budget)
+            return
+        msg = f"Heating system did not confirm the command within {budget:.1f}s"
+        raise HomeAssistantError(msg)
+
+    async def async_apply_state(
+        self,
+        statuses: dict[str, bool],
+        temperature: float | None = None,
+    ) -> None:
+        """
+        Bring the heater to the desired state with as few commands as possible.
+
+        The planned commands are sent back to back and the result is checked
+        with a single poll once the controller has had time to settle.
+        """
+        plan = plan_commands(self.data, statuses, temperature)
+        if not plan:
+            return
+        LOGGER.debug("Applying state with %s", plan)
+        self.async_note_command()
+        await self.config_entry.runtime_data.client.async_send_commands(
+            plan, TEMP_PULSE_INTERVAL
+        )
+        await asyncio.sleep(self.settle_time)
+        await self.async_refresh()
+
+        data = self.data
+        mismatched = [key for key, on in statuses.items() if getattr(data, key) != on]
+        if temperature is not None and (
+            data.air_temperature_target is None
+            or round((temperature - data.air_temperature_target) / TEMP_STEP)
+        ):
+            mismatched.append("air_temperature_target")
+        if mismatched:
+            msg = f"Heating system did not reach the requested {', '.join(mismatched)}"
+            raise HomeAssistantError(msg)
+
+    def _learn_settle_time(self, latency: float) -> None:
+        """Fold an observed command-to-page latency into the settle estimate."""
+        self.config_entry.runtime_data.client.stats.confirm.record(latency)
+        self.settle_time += (latency - self.settle_time) * 0.3
+        LOGGER.debug(
+            "Command confirmed after %.2fs, settle estimate now %.2fs",
+            latency,
+            self.settle_time,
+        )
+
+    def _raise_if_replaying(self) -> None:
+        """Refuse to send commands while a trace is replayed."""
+        if self._replaying:
+            msg = "Commands are not sent while a trace is being replayed"
+            raise HomeAssistantError(msg)
+
+    async def async_replay(
+        self, events: list[HacsBobilTraceEvent], speed: float
+    ) -> dict[str, Any]:
+        """
+        Feed the polls of a captured trace through the coordinator.
+
+        Each poll is refreshed at its recorded time divided by `speed`, or
+        straight after the previous one with a `speed` of 0. The replay gets a
+        history of its own, scheduled polls are suspended, commands are
+        refused, and nothing is saved or added to long-term statistics
+        meanwhile. Afterwards the live snapshot is restored, flagged as stale
+        until the live poll that follows succeeds. Returns the number of
+        polls, the time taken and the replay's stats.
+        """
+        client = self.config_entry.runtime_data.client
+        polls = [event for event in events if event.path == PAGE_PATH]
+        if not polls:
+            msg = "The trace holds no polls"
+            raise HomeAssistantError(msg)
+        transport = HacsBobilReplayTransport(polls, speed)
+        if self._save_pending:
+            # Write the live snapshot now; a delayed save would pick up
+            # replayed data.
+            await self._store.async_save(self._data_to_store())
+        live = (self._last_successful_data, self._last_fields)
+        statistics, self.statistics = self.statistics, None
+        history, self.history = self.history, HacsBobilHistory(HISTORY_FIELDS)
+        self._replaying = True
+        self._unschedule_refresh()
+        started = monotonic()
+        try:
+            with client.replaying(transport) as stats:
+                for index, event in enumerate(polls):
+                    if speed:
+                        due = started + (event.time - polls[0].time) / speed
+                        await asyncio.sleep(max(due - monotonic(), 0))
+                    transport.cursor = index
+                    client.scheduler.invalidate()
+                    await self.async_refresh()
+        finally:
+            self.statistics = statistics
+            self.history = history
+            self._replaying = False
+            if live[0] is not None:
+                self._last_successful_data, self._last_fields = live
+                self._last_digest = None
+                self.stale = True
+                self.async_set_updated_data(live[0])
+        duration = monotonic() - started
+        await self.async_request_refresh()
+        return {"polls": len(polls), "duration": duration, "stats": stats.as_dict()}
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll, unless a replay is running."""
+        if not self._replaying:
+            super()._schedule_refresh()
+
+    async def _async_update_data(
+        self, max_age: float = PAGE_MAX_AGE
+    ) -> HacsBobilSnapshot:
+        """
+        Update data via library.
+
+        A page fetched less than `max_age` seconds ago is reused.
+        """
+        client = self.config_entry.runtime_data.client
         try:
-            data = await self.config_entry.runtime_data.client.async_get_data()
-            # Store successful data for fallback
-            self._last_successful_data = data
-            return data
+            body, complete = await client.async_get_page(max_age)
         except HacsBobilApiClientCommunicationError as exception:
-            # Communication error - preserve last good data if available
-            LOGGER.warning(
-                "Communication error with heating system: %s. Using cached data.",
-                exception,
-            )
+            # Communication error - preserve last good data if available.
+            # Only the first error of an outage is logged as a warning.
+            if not self._communication_failing:
+                self._communication_failing = True
+                LOGGER.warning(
+                    "Communication error with heating system: %s. Using cached data.",
+                    exception,
+                )
+            else:
+                LOGGER.debug("Heating system still unreachable: %s", exception)
+            if not self._replaying:
+                self.runtime.interrupt()
+            self._adapt_update_interval(None, reachable=False)
             if self._last_successful_data is not None:
                 return self._last_successful_data
             raise UpdateFailed(exception) from exception
         except HacsBobilApiClientError as exception:
             # Other errors should still fail
+            if not self._replaying:
+                self.runtime.interrupt()
+            self._adapt_update_interval(None, reachable=False)
             raise UpdateFailed(exception) from exception
+
+        self.last_contact = dt_util.utcnow()
+        if self._communication_failing:
+            self._communication_failing = False
+            LOGGER.info("Communication with heating system restored")
+        # The first live poll after a restore always yields a fresh snapshot
+        # so that entities drop the stale flag.
+        was_stale, self.stale = self.stale, False
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if (
+            digest == self._last_digest
+            and self._last_successful_data is not None
+            and not was_stale
+        ):
+            self._record_readings(self._last_fields)
+            self._adapt_update_interval(None)
+            return self._last_successful_data
+
+        try:
+            fields = client.parse_page(body, complete=complete)
+        except HacsBobilApiClientError as exception:
+            raise UpdateFailed(exception) from exception
+        self._last_digest = digest
+        if not complete and self._last_fields is not None:
+            # The body was cut off; keep the previous value of what is missing.
+            fields = dataclasses.replace(
+                self._last_fields,
+                **{
+                    key: value
+                    for key, value in fields.as_dict().items()
+                    if value is not None
+                },
+            )
+        self._record_readings(fields)
+
+        # The page can change without any field changing (e.g. markup only),
+        # in which case the previous snapshot is kept as is.
+        if (
+            fields == self._last_fields
+            and self._last_successful_data is not None
+            and not was_stale
+        ):
+            self._adapt_update_interval(None)
+            return self._last_successful_data
+
+        previous, self._last_fields = self._last_fields, fields
+        self._adapt_update_interval(previous or HacsBobilSnapshot())
+        # Store successful data for fallback
+        self._last_successful_data = dataclasses.replace(
+            fields, last_update=self.last_contact
+        )
+        self._async_schedule_save()
+        return self._last_successful_data
+
+    def _record_readings(self, fields: HacsBobilSnapshot) -> None:
+        """Add the readings of a successful poll to the history and counters."""
+        self.history.add(monotonic(), fields)
+        if self.statistics is not None:
+            self.statistics.add(self.last_contact, fields)
+        if not self._replaying:
+            self.runtime.add(self.last_contact, fields, self._runtime_max_gap())
+            if self.runtime.active:
+                self._async_schedule_save()
+            self._async_update_runtime_listeners()
+
+    @callback
+    def _async_update_runtime_listeners(self) -> None:
+        """
+        Call the listeners showing the runtime counters.
+
+        The counters move with every poll, also when the page is unchanged
+        and the other listeners are not called.
+        """
+        for update_callback, context in list(self._listeners.values()):
+            if context is not None and RUNTIME_CONTEXT in context:
+                update_callback()
+
+    def _runtime_max_gap(self) -> float:
+        """Return the longest gap between polls that is credited as runtime."""
+        return (
+            self.poll_ceiling.total_seconds() * (1 + POLL_JITTER)
+            + self.config_entry.runtime_data.client.timeout
+        )
+
+    def _adapt_update_interval(
+        self, previous: HacsBobilSnapshot | None, *, reachable: bool = True
+    ) -> None:
+        """
+        Pick the interval until the next poll.
+
+        `previous` holds the fields before this poll when they changed, and is
+        None when the poll brought nothing new. A poll that failed backs off
+        like an unchanged one: the last known heater state says nothing about
+        when the controller will be back.
+        """
+        fields = self._last_fields or HacsBobilSnapshot()
+        status = fields.van_heating_status or ""
+        if reachable and (
+            monotonic() < self._boost_until
+            or fields.heating_mode != "OFF"
+            or any(word in status for word in TRANSITIONAL_HEATING_STATUSES)
+            or (
+                previous is not None
+                and any(
+                    getattr(previous, key) != getattr(fields, key)
+                    for key in POLL_RESET_FIELDS
+                )
+            )
+        ):
+            interval = self.poll_floor
+        elif previous is not None:
+            # Only readings drifted; hold the current pace.
+            interval = self._base_interval
+        else:
+            interval = min(
+                self._base_interval * POLL_BACKOFF_FACTOR,
+                self.poll_ceiling,
+            )
+        if interval != self._base_interval:
+            LOGGER.debug("Polling %s every %s", self.config_entry.title, interval)
+            self._base_interval = interval
+        self.update_interval = interval * random.uniform(  # noqa: S311
+            1 - POLL_JITTER, 1 + POLL_JITTER
+        )
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+from .fleet import HacsBobilFleet
+from .scheduler import HacsBobilRequestScheduler
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
@@ -23,3 +28,91 @@ class HacsBobilData:
     client: HacsBobilApiClient
     coordinator: BlueprintDataUpdateCoordinator
     integration: Integration
+
+
+@dataclass
+class HacsBobilShared:
+    """
+    State shared by the loaded entries, kept in `hass.data[DOMAIN]`.
+
+    It is created when the first entry is set up and dropped when the last
+    one is unloaded, so nothing outlives the integration.
+    """
+
+    fleet: HacsBobilFleet = field(default_factory=HacsBobilFleet)
+    schedulers: dict[str, HacsBobilRequestScheduler] = field(default_factory=dict)
+    entries: set[str] = field(default_factory=set)
+
+    def scheduler(self, host: str) -> HacsBobilRequestScheduler:
+        """Return the scheduler shared by every client of `host`."""
+        if (scheduler := self.schedulers.get(host)) is None:
+            scheduler = self.schedulers[host] = HacsBobilRequestScheduler()
+        return scheduler
+
+
+@dataclass(frozen=True, slots=True)
+class HacsBobilSnapshot:
+    """
+    One reading of the controller page.
+
+    Fields missing from the page are None. `heating_mode` is derived from the
+    three heating statuses once, when the snapshot is created, so that entity
+    state writes are plain attribute reads.
+    """
+
+    air_temperature: float | None = None
+    air_temperature_target: float | None = None
+    water_tank_temperature: float | None = None
+    water_level: float | None = None
+    system_number: str | None = None
+    air_heating_status: bool | None = None
+    water_heating_status: bool | None = None
+    combined_heating_status: bool | None = None
+    van_heating_status: str | None = None
+    last_update: datetime | None = None
+    heating_mode: str = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the heating mode from the individual heating statuses."""
+        air = self.air_heating_status
+        water = self.water_heating_status
+        if self.combined_heating_status or (air and water):
+            mode = "BOTH"
+        elif air:
+            mode = "AIR"
+        elif water:
+            mode = "WATER"
+        else:
+            mode = "OFF"
+        object.__setattr__(self, "heating_mode", mode)
+
+    def changed_fields(self, other: HacsBobilSnapshot) -> set[str]:
+        """Return the names of the fields, derived ones included, that differ."""
+        return {
+            item.name
+            for item in fields(self)
+            if getattr(self, item.name) != getattr(other, item.name)
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the page fields, without `last_update` and derived fields."""
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if item.init and item.name != "last_update"
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], last_update: datetime | None = None
+    ) -> HacsBobilSnapshot:
+        """Build a snapshot from `as_dict` output, ignoring unknown keys."""
+        known = {
+            item.name
+            for item in fields(cls)
+            if item.init and item.name != "last_update"
+        }
+        return cls(
+            **{key: value for key, value in data.items() if key in known},
+            last_update=last_update,
+        )
@@ -0,0 +1,52 @@
+"""Diagnostics support for hacs_bobil."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import HacsBobilConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: HacsBobilConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    breaker = client.breaker
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval,
+            "last_contact": coordinator.last_contact,
+            "stale": coordinator.stale,
+            "settle_time": coordinator.settle_time,
+        },
+        "runtime": coordinator.runtime.as_dict(),
+        "stats": client.stats.as_dict(),
+        "scheduler": {
+            "queue_depth": client.scheduler.queue_depth,
+            "waits": client.scheduler.waits.as_dict(),
+            "preemptions": client.scheduler.preemptions,
+        },
+        "breaker": {
+            "open": breaker.is_open,
+            "failures": breaker.failures,
+        },
+        "fleet": {
+            "active": client.fleet.active,
+            "waiting": client.fleet.waiting,
+        },
+        "fields": sorted(client.fields),
+        "data": coordinator.data and dataclasses.asdict(coordinator.data),
+        "trace": client.trace and client.trace.as_dict(),
+    }
@@ -0,0 +1,112 @@
+"""Discovery of Bobil controllers on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .const import (
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_READ_LIMIT,
+    DISCOVERY_SIGNATURE,
+    DISCOVERY_TIMEOUT,
+    DISCOVERY_WORKERS,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+
+def parse_networks(text: str) -> list[ipaddress.IPv4Network]:
+    """
+    Parse comma or space separated subnets, e.g. "192.168.1.0/24".
+
+    Raises ValueError for anything that is not an IPv4 network or that would
+    make the scan larger than `DISCOVERY_MAX_HOSTS`.
+    """
+    networks = [
+        ipaddress.IPv4Network(part, strict=False)
+        for part in text.replace(",", " ").split()
+    ]
+    if sum(network.num_addresses for network in networks) > DISCOVERY_MAX_HOSTS:
+        msg = f"Subnets cover more than {DISCOVERY_MAX_HOSTS} addresses"
+        raise ValueError(msg)
+    return networks
+
+
+def _candidates(networks: Iterable[ipaddress.IPv4Network]) -> list[str]:
+    """Return the hosts to probe, without duplicates, in subnet order."""
+    hosts: dict[str, None] = {}
+    for network in networks:
+        for address in network.hosts() if network.prefixlen < 31 else network:  # noqa: PLR2004
+            hosts.setdefault(str(address))
+    return list(hosts)
+
+
+async def _async_probe(session: aiohttp.ClientSession, host: str) -> bool:
+    """Return whether `host` serves a Bobil controller page."""
+    timeout = aiohttp.ClientTimeout(
+        total=DISCOVERY_TIMEOUT, sock_connect=DISCOVERY_CONNECT_TIMEOUT
+    )
+    try:
+        async with session.get(f"http://{host}/", timeout=timeout) as response:
+            if response.status != 200:  # noqa: PLR2004
+                return False
+            head = b""
+            while len(head) < DISCOVERY_READ_LIMIT and (
+                chunk := await response.content.read(DISCOVERY_READ_LIMIT - len(head))
+            ):
+                head += chunk
+    except (TimeoutError, aiohttp.ClientError, OSError):
+        return False
+    return all(marker in head for marker in DISCOVERY_SIGNATURE)
+
+
+async def async_scan(
+    session: aiohttp.ClientSession,
+    networks: Iterable[ipaddress.IPv4Network],
+    workers: int = DISCOVERY_WORKERS,
+) -> AsyncIterator[str]:
+    """
+    Yield the hosts of the given networks that look like a Bobil controller.
+
+    A fixed pool of workers probes the candidates concurrently with short
+    timeouts, and each match is yielded as soon as it is found. Closing the
+    generator early cancels the remaining probes.
+    """
+    candidates = _candidates(networks)
+    pending: asyncio.Queue[str] = asyncio.Queue()
+    for host in candidates:
+        pending.put_nowait(host)
+    found: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def _worker() -> None:
+        while not pending.empty():
+            host = pending.get_nowait()
+            if await _async_probe(session, host):
+                found.put_nowait(host)
+
+    tasks = [
+        asyncio.ensure_future(_worker()) for _ in range(min(workers, len(candidates)))
+    ]
+    LOGGER.debug("Scanning %s hosts with %s workers", len(candidates), len(tasks))
+
+    async def _finish() -> None:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        found.put_nowait(None)
+
+    finisher = asyncio.ensure_future(_finish())
+    try:
+        while (host := await found.get()) is not None:
+            yield host
+    finally:
+        for task in (*tasks, finisher):
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.gather(*tasks, finisher, return_exceptions=True)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION
+from .const import ATTR_STALE, ATTRIBUTION
 from .coordinator import BlueprintDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class HacsBobilEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
     """BlueprintEntity class."""
@@ -15,9 +20,18 @@ class HacsBobilEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = False
 
-    def __init__(self, coordinator: BlueprintDataUpdateCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        fields: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize.
+
+        The entity is only written when one of the snapshot `fields` it shows
+        changes, or when availability or the stale flag changes.
+        """
+        super().__init__(coordinator, context=frozenset(fields))
         self._attr_device_info = DeviceInfo(
             identifiers={
                 (
@@ -29,3 +43,10 @@ class HacsBobilEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
             manufacturer="Bobil Vans",
             model="Heating Control System",
         )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state restored from storage that the van has not confirmed yet."""
+        if self.coordinator.stale:
+            return {ATTR_STALE: True}
+        return None
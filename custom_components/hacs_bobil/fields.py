@@ -0,0 +1,232 @@
+"""Registry of the values shown on the controller page."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTemperature
+
+from .const import (
+    ATTR_AIR_HEATING,
+    ATTR_COMBINED_HEATING,
+    ATTR_WATER_HEATING,
+    ENDPOINT_AIR_OFF,
+    ENDPOINT_AIR_ON,
+    ENDPOINT_COMBINED_OFF,
+    ENDPOINT_COMBINED_ON,
+    ENDPOINT_WATER_OFF,
+    ENDPOINT_WATER_ON,
+    SENSOR_MIN_INTERVAL,
+    TEMPERATURE_DEADBAND,
+    WATER_LEVEL_DEADBAND,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+def _on_off(value: bytes) -> bool:
+    """Convert an ON/OFF status word to a boolean."""
+    return value == b"ON"
+
+
+def _text(value: bytes) -> str:
+    """Decode a captured page value."""
+    return value.decode(errors="replace").strip()
+
+
+@dataclass(frozen=True, slots=True)
+class HacsBobilField:
+    """
+    One value on the controller page: how to parse it and how to show it.
+
+    `pattern` captures the value in a group named after `key` and is matched
+    right after the opening tag of `element`; `converter` turns the captured
+    bytes into the snapshot value. `platform` is the entity platform showing
+    the field, described by the remaining attributes. Device and state
+    classes are given by value and converted by the platform. A status with
+    `endpoints`, the on and off commands, is also shown as a switch, and
+    `service` is its field in the `apply_state` service.
+
+    A numeric field with `history` is kept in the rolling history, and with
+    `statistics` aggregated into long-term statistics. A status with
+    `runtime` gets on-time, cycle and duty cycle counters.
+    """
+
+    key: str
+    element: str
+    pattern: str
+    converter: Callable[[bytes], Any]
+    platform: Platform | None = None
+    name: str | None = None
+    icon: str | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    enabled_default: bool = True
+    # Sensor write filtering, see HacsBobilSensorEntityDescription
+    deadband: float = 0
+    min_interval: float = 0
+    history: bool = False
+    statistics: bool = False
+    runtime: bool = False
+    endpoints: tuple[str, str] | None = None
+    service: str | None = None
+
+
+PAGE_FIELDS = (
+    HacsBobilField(
+        key="air_temperature",
+        element="p",
+        pattern=r"AIR TEMP:\s*(?P<air_temperature>[-\d.]+)&deg;C",
+        converter=float,
+        platform=Platform.SENSOR,
+        name="Air Temperature",
+        icon="mdi:thermometer",
+        unit=UnitOfTemperature.CELSIUS,
+        device_class="temperature",
+        state_class="measurement",
+        deadband=TEMPERATURE_DEADBAND,
+        min_interval=SENSOR_MIN_INTERVAL,
+        history=True,
+        statistics=True,
+    ),
+    HacsBobilField(
+        key="air_temperature_target",
+        element="p",
+        pattern=r"AIR TEMP TARGET:\s*(?P<air_temperature_target>[-\d.]+)&deg;C",
+        converter=float,
+        platform=Platform.SENSOR,
+        name="Air Temperature Target",
+        icon="mdi:thermometer-chevron-up",
+        unit=UnitOfTemperature.CELSIUS,
+        device_class="temperature",
+        history=True,
+    ),
+    HacsBobilField(
+        key="water_tank_temperature",
+        element="p",
+        pattern=r"WATER TANK TEMP:\s*(?P<water_tank_temperature>[-\d.]+)&deg;C",
+        converter=float,
+        platform=Platform.SENSOR,
+        name="Water Tank Temperature",
+        icon="mdi:water-thermometer",
+        unit=UnitOfTemperature.CELSIUS,
+        device_class="temperature",
+        state_class="measurement",
+        deadband=TEMPERATURE_DEADBAND,
+        min_interval=SENSOR_MIN_INTERVAL,
+        history=True,
+        statistics=True,
+    ),
+    HacsBobilField(
+        key="water_level",
+        element="p",
+        pattern=r"WATER LEVEL:\s*(?P<water_level>[-\d.]+)%",
+        converter=float,
+        platform=Platform.SENSOR,
+        name="Water Level",
+        icon="mdi:water-percent",
+        unit=PERCENTAGE,
+        state_class="measurement",
+        deadband=WATER_LEVEL_DEADBAND,
+        min_interval=SENSOR_MIN_INTERVAL,
+        history=True,
+        statistics=True,
+    ),
+    HacsBobilField(
+        key="system_number",
+        element="p",
+        # The number must run up to the next tag, so a cut-off one never matches
+        pattern=r"SYSTEM NO:\s*(?P<system_number>\d+)(?=\s*<)",
+        converter=_text,
+        platform=Platform.SENSOR,
+        name="System Number",
+        icon="mdi:identifier",
+    ),
+    # Van heating status message (e.g., "HEATER COOLING")
+    HacsBobilField(
+        key="van_heating_status",
+        element="h3",
+        pattern=r"(?P<van_heating_status>.*?)</h3>",
+        converter=_text,
+        platform=Platform.SENSOR,
+        name="Van Heating Status",
+        icon="mdi:radiator",
+    ),
+    HacsBobilField(
+        key="air_heating_status",
+        element="p",
+        pattern=r"AIR HEATING STATUS:\s*(?P<air_heating_status>ON|OFF)",
+        converter=_on_off,
+        platform=Platform.BINARY_SENSOR,
+        name="Air Heating",
+        icon="mdi:radiator",
+        device_class="heat",
+        enabled_default=False,
+        endpoints=(ENDPOINT_AIR_ON, ENDPOINT_AIR_OFF),
+        runtime=True,
+        service=ATTR_AIR_HEATING,
+    ),
+    HacsBobilField(
+        key="water_heating_status",
+        element="p",
+        pattern=r"WATER HEATING STATUS:\s*(?P<water_heating_status>ON|OFF)",
+        converter=_on_off,
+        platform=Platform.BINARY_SENSOR,
+        name="Water Heating",
+        icon="mdi:water-boiler",
+        device_class="heat",
+        enabled_default=False,
+        endpoints=(ENDPOINT_WATER_ON, ENDPOINT_WATER_OFF),
+        runtime=True,
+        service=ATTR_WATER_HEATING,
+    ),
+    HacsBobilField(
+        key="combined_heating_status",
+        element="p",
+        pattern=r"AIR AND WATER HEATING STATUS:\s*(?P<combined_heating_status>ON|OFF)",
+        converter=_on_off,
+        platform=Platform.BINARY_SENSOR,
+        name="Combined Heating",
+        icon="mdi:fire",
+        device_class="heat",
+        enabled_default=False,
+        endpoints=(ENDPOINT_COMBINED_ON, ENDPOINT_COMBINED_OFF),
+        runtime=True,
+        service=ATTR_COMBINED_HEATING,
+    ),
+)
+
+PAGE_KEYS = frozenset(field.key for field in PAGE_FIELDS)
+# On and off command of each status that can be switched
+STATUS_ENDPOINTS = {
+    field.key: field.endpoints for field in PAGE_FIELDS if field.endpoints
+}
+# Numeric fields kept in the rolling history
+HISTORY_FIELDS = tuple(field.key for field in PAGE_FIELDS if field.history)
+# Heating statuses whose on-time and cycles are counted
+RUNTIME_FIELDS = tuple(field.key for field in PAGE_FIELDS if field.runtime)
+# Readings aggregated into long-term statistics: (name, unit)
+STATISTICS_FIELDS = {
+    field.key: (field.name, field.unit) for field in PAGE_FIELDS if field.statistics
+}
+# apply_state service fields and the status they set
+SERVICE_FIELDS = {field.service: field.key for field in PAGE_FIELDS if field.service}
+# Snapshot fields derived from page fields, and the fields they are derived from
+DERIVED_FIELDS = {
+    "heating_mode": (
+        "air_heating_status",
+        "water_heating_status",
+        "combined_heating_status",
+    ),
+}
+
+
+def page_keys(keys: Iterable[str]) -> frozenset[str]:
+    """Return the page fields needed to fill the given snapshot fields."""
+    needed: set[str] = set()
+    for key in keys:
+        needed.update(DERIVED_FIELDS.get(key, (key,)))
+    return PAGE_KEYS.intersection(needed)
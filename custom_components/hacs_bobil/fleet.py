@@ -0,0 +1,125 @@
+"""Fleet-wide poll scheduling for hacs_bobil."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from .const import FLEET_MAX_CONCURRENT_POLLS, FLEET_MAX_UNREACHABLE_POLLS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class HacsBobilFleet:
+    """
+    Share poll capacity between every controller this instance talks to.
+
+    Polls of all hosts go through one gate with a global concurrency cap.
+    When a slot frees up, hosts waiting for one are served round-robin, with
+    reachable hosts first; hosts whose last poll failed only get a small
+    share of the slots, so dead vans waiting out their timeouts cannot starve
+    the live ones.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FLEET_MAX_CONCURRENT_POLLS,
+        max_unreachable: int = FLEET_MAX_UNREACHABLE_POLLS,
+    ) -> None:
+        """Initialize the fleet."""
+        self._max_concurrent = max_concurrent
+        self._max_unreachable = max_unreachable
+        self._active = 0
+        self._active_unreachable = 0
+        self._waiting: dict[str, list[asyncio.Future[bool]]] = {}
+        self._hosts: list[str] = []
+        self._next = 0
+        self._unreachable: set[str] = set()
+
+    @property
+    def active(self) -> int:
+        """Return the number of polls in flight."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of polls waiting for a slot."""
+        return sum(
+            1
+            for waiters in self._waiting.values()
+            for waiter in waiters
+            if not waiter.done()
+        )
+
+    def report(self, host: str, *, reachable: bool) -> None:
+        """Record the outcome of the last poll of `host`."""
+        if reachable:
+            self._unreachable.discard(host)
+        else:
+            self._unreachable.add(host)
+
+    @asynccontextmanager
+    async def async_poll_slot(self, host: str) -> AsyncIterator[None]:
+        """Hold one of the fleet's poll slots for `host`."""
+        unreachable = await self._async_acquire(host)
+        try:
+            yield
+        finally:
+            self._release(unreachable=unreachable)
+
+    async def _async_acquire(self, host: str) -> bool:
+        """Wait for a slot; return whether it counts as an unreachable one."""
+        if host not in self._hosts:
+            self._hosts.append(host)
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(host, []).append(waiter)
+        self._dispatch()
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # The slot may have been granted just before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self._release(unreachable=waiter.result())
+            raise
+
+    def _release(self, *, unreachable: bool) -> None:
+        """Free a slot and hand it on."""
+        self._active -= 1
+        if unreachable:
+            self._active_unreachable -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting hosts, round-robin."""
+        while self._active < self._max_concurrent and (host := self._pick_host()):
+            waiter = self._waiting[host].pop(0)
+            if not self._waiting[host]:
+                del self._waiting[host]
+            unreachable = host in self._unreachable
+            self._active += 1
+            if unreachable:
+                self._active_unreachable += 1
+            waiter.set_result(unreachable)
+
+    def _pick_host(self) -> str | None:
+        """Return the next host to serve, preferring reachable ones."""
+        for waiters in self._waiting.values():
+            waiters[:] = [waiter for waiter in waiters if not waiter.done()]
+        fallback = None
+        count = len(self._hosts)
+        for offset in range(count):
+            index = (self._next + offset) % count
+            host = self._hosts[index]
+            if not self._waiting.get(host):
+                continue
+            if host not in self._unreachable:
+                self._next = index + 1
+                return host
+            if fallback is None and self._active_unreachable < self._max_unreachable:
+                fallback = index
+        if fallback is None:
+            return None
+        self._next = fallback + 1
+        return self._hosts[fallback]
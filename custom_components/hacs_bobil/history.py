@@ -0,0 +1,175 @@
+"""Rolling in-memory history of snapshot readings."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from .const import HISTORY_MIN_SPAN, HISTORY_SIZE, HISTORY_WINDOW
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .data import HacsBobilSnapshot
+
+
+class HacsBobilRollingWindow:
+    """
+    Timestamped samples of one reading in a fixed-size ring buffer.
+
+    Samples drop out once the buffer is full or they are older than `window`
+    seconds. The sums behind the least-squares slope and the monotonic queues
+    behind the minimum and maximum are updated as samples come and go, so
+    adding a sample and reading any statistic is O(1) amortized. Timestamps
+    are stored relative to an origin that is moved to the oldest sample once
+    per buffer length, keeping the sums well conditioned however long the
+    process runs.
+    """
+
+    __slots__ = (
+        "_added",
+        "_capacity",
+        "_count",
+        "_head",
+        "_max",
+        "_min",
+        "_origin",
+        "_sum_t",
+        "_sum_tt",
+        "_sum_tv",
+        "_sum_v",
+        "_times",
+        "_values",
+        "_window",
+    )
+
+    def __init__(
+        self, capacity: int = HISTORY_SIZE, window: float = HISTORY_WINDOW
+    ) -> None:
+        """Initialize the window."""
+        self._capacity = capacity
+        self._window = window
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+        self._added = 0
+        self._origin: float | None = None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        # (sequence number, value) pairs with increasing / decreasing values
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample taken at `timestamp` (monotonic seconds)."""
+        if self._origin is None:
+            self._origin = timestamp
+        elif self._added % self._capacity == 0:
+            self._rebase()
+        while self._count and (
+            self._count == self._capacity
+            or timestamp - self._origin - self._times[self._head] > self._window
+        ):
+            self._evict()
+
+        t = timestamp - self._origin
+        index = (self._head + self._count) % self._capacity
+        self._times[index] = t
+        self._values[index] = value
+        self._count += 1
+        self._sum_t += t
+        self._sum_v += value
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+
+        sequence = self._added
+        self._added += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((sequence, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((sequence, value))
+
+    def _evict(self) -> None:
+        """Drop the oldest sample."""
+        t = self._times[self._head]
+        value = self._values[self._head]
+        self._sum_t -= t
+        self._sum_v -= value
+        self._sum_tt -= t * t
+        self._sum_tv -= t * value
+        oldest = self._added - self._count
+        if self._min[0][0] == oldest:
+            self._min.popleft()
+        if self._max[0][0] == oldest:
+            self._max.popleft()
+        self._head = (self._head + 1) % self._capacity
+        self._count -= 1
+
+    def _rebase(self) -> None:
+        """Move the time origin to the oldest sample and recompute the sums."""
+        if not self._count:
+            return
+        shift = self._times[self._head]
+        self._origin += shift
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        for offset in range(self._count):
+            index = (self._head + offset) % self._capacity
+            t = self._times[index] = self._times[index] - shift
+            value = self._values[index]
+            self._sum_t += t
+            self._sum_v += value
+            self._sum_tt += t * t
+            self._sum_tv += t * value
+
+    @property
+    def span(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        if not self._count:
+            return 0.0
+        newest = (self._head + self._count - 1) % self._capacity
+        return self._times[newest] - self._times[self._head]
+
+    @property
+    def slope(self) -> float | None:
+        """Return the least-squares rate of change, per second."""
+        if self._count < 2 or self.span < HISTORY_MIN_SPAN:  # noqa: PLR2004
+            return None
+        denominator = self._count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return (self._count * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the lowest value in the window."""
+        return self._min[0][1] if self._min else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the highest value in the window."""
+        return self._max[0][1] if self._max else None
+
+
+class HacsBobilHistory:
+    """Rolling windows of the numeric snapshot fields."""
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize the history."""
+        self._windows = {key: HacsBobilRollingWindow() for key in keys}
+
+    def __getitem__(self, key: str) -> HacsBobilRollingWindow:
+        """Return the window of `key`."""
+        return self._windows[key]
+
+    def add(self, timestamp: float, snapshot: HacsBobilSnapshot) -> None:
+        """Add the readings of `snapshot` that are known."""
+        for key, window in self._windows.items():
+            if (value := getattr(snapshot, key)) is not None:
+                window.add(timestamp, value)
@@ -0,0 +1,163 @@
+"""Heater on-time, cycle and duty-cycle accounting."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    RUNTIME_BUCKETS,
+    RUNTIME_WINDOW,
+)
+from .fields import RUNTIME_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from .data import HacsBobilSnapshot
+
+_BUCKET = RUNTIME_WINDOW / RUNTIME_BUCKETS
+
+
+class HacsBobilRuntime:
+    """
+    Running on-time and cycle counters of the heating modes.
+
+    Each snapshot credits the time since the previous one to the modes that
+    were on and counts an off to on change as a cycle. Only time between two
+    successful polls is credited: a gap longer than the caller's `max_gap`, a
+    failed poll (`interrupt`) and a restart (`load`) all start over without
+    crediting anything.
+
+    Besides the totals, on-time and observed time are kept for the current
+    local day and in `RUNTIME_BUCKETS` buckets spanning the rolling
+    `RUNTIME_WINDOW`, so duty cycles cover only time the heater was actually
+    watched. Adding a snapshot and reading any counter is O(1).
+    """
+
+    __slots__ = (
+        "_day",
+        "_last",
+        "_on",
+        "_slot",
+        "_window_on",
+        "_window_seen",
+        "cycles",
+        "today",
+        "today_seen",
+        "total",
+    )
+
+    def __init__(self, keys: Iterable[str] = RUNTIME_FIELDS) -> None:
+        """Initialize the counters."""
+        keys = tuple(keys)
+        self.total = dict.fromkeys(keys, 0.0)
+        self.cycles = dict.fromkeys(keys, 0)
+        self.today = dict.fromkeys(keys, 0.0)
+        self.today_seen = 0.0
+        self._on: dict[str, bool | None] = dict.fromkeys(keys)
+        self._window_on = {key: [0.0] * RUNTIME_BUCKETS for key in keys}
+        self._window_seen = [0.0] * RUNTIME_BUCKETS
+        self._day: int | None = None
+        self._slot: int | None = None
+        self._last: float | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether any mode is on, i.e. the counters are moving."""
+        return any(self._on.values())
+
+    def add(self, now: datetime, snapshot: HacsBobilSnapshot, max_gap: float) -> None:
+        """Account for the time since the previous snapshot, up to `max_gap`."""
+        timestamp = now.timestamp()
+        elapsed = 0.0
+        if self._last is not None and 0 < timestamp - self._last <= max_gap:
+            elapsed = timestamp - self._last
+        self._last = timestamp
+        self._roll_day(dt_util.as_local(now).toordinal())
+        bucket = self._roll_window(int(timestamp // _BUCKET))
+        self.today_seen += elapsed
+        self._window_seen[bucket] += elapsed
+        for key, was_on in self._on.items():
+            if was_on:
+                self.total[key] += elapsed
+                self.today[key] += elapsed
+                self._window_on[key][bucket] += elapsed
+            if (on := getattr(snapshot, key)) is None:
+                continue
+            if on and was_on is False:
+                self.cycles[key] += 1
+            self._on[key] = on
+
+    def interrupt(self) -> None:
+        """Credit nothing up to the next snapshot, e.g. after a failed poll."""
+        self._last = None
+
+    def _roll_day(self, day: int) -> None:
+        """Start a new day's counters at local midnight."""
+        if day != self._day:
+            self._day = day
+            self.today = dict.fromkeys(self.today, 0.0)
+            self.today_seen = 0.0
+
+    def _roll_window(self, slot: int) -> int:
+        """Clear the buckets that fell out of the window; return the current one."""
+        if self._slot is None or not 0 <= slot - self._slot < RUNTIME_BUCKETS:
+            cleared = range(RUNTIME_BUCKETS)
+        else:
+            cleared = range(self._slot + 1, slot + 1)
+        for index in cleared:
+            self._window_seen[index % RUNTIME_BUCKETS] = 0.0
+            for buckets in self._window_on.values():
+                buckets[index % RUNTIME_BUCKETS] = 0.0
+        self._slot = slot
+        return slot % RUNTIME_BUCKETS
+
+    def duty_cycle_today(self, key: str) -> float | None:
+        """Return the percentage of today's observed time `key` was on."""
+        if not self.today_seen:
+            return None
+        return round(self.today[key] / self.today_seen * 100, 1)
+
+    def duty_cycle_window(self, key: str) -> float | None:
+        """Return the percentage of the rolling window `key` was on."""
+        if not (seen := sum(self._window_seen)):
+            return None
+        return round(sum(self._window_on[key]) / seen * 100, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a copy of the counters to save."""
+        return {
+            "total": dict(self.total),
+            "cycles": dict(self.cycles),
+            "today": dict(self.today),
+            "today_seen": self.today_seen,
+            "on": dict(self._on),
+            "window_on": {key: list(value) for key, value in self._window_on.items()},
+            "window_seen": list(self._window_seen),
+            "day": self._day,
+            "slot": self._slot,
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """
+        Restore counters saved with `as_dict`; unknown modes are skipped.
+
+        The time until the first snapshot after loading is not credited, as
+        nothing was watched while Home Assistant was down.
+        """
+        for key in self.total:
+            self.total[key] = data["total"].get(key, 0.0)
+            self.cycles[key] = data["cycles"].get(key, 0)
+            self.today[key] = data["today"].get(key, 0.0)
+            self._on[key] = data["on"].get(key)
+            if len(window := data["window_on"].get(key, ())) == RUNTIME_BUCKETS:
+                self._window_on[key] = list(window)
+        if len(data["window_seen"]) == RUNTIME_BUCKETS:
+            self._window_seen = list(data["window_seen"])
+        self.today_seen = data["today_seen"]
+        self._day = data["day"]
+        self._slot = data["slot"]
+        self._last = None
@@ -0,0 +1,158 @@
+"""Per-host request scheduler for hacs_bobil."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER, REQUEST_BURST, REQUEST_RATE
+from .stats import HacsBobilHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Lower runs first.
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class HacsBobilRequestScheduler:
+    """
+    Serialize all traffic to one controller.
+
+    The controller is a single-connection web server, so at most one request
+    is in flight at a time. Queued commands run before queued polls, and a
+    command arriving while a poll is in flight cancels that poll, which is
+    re-queued behind it. Request starts are rate limited with a token bucket.
+
+    Page fetches can also go through `async_single_flight`, so concurrent
+    callers, including other clients of the same host, share one fetch.
+    """
+
+    def __init__(self, rate: float = REQUEST_RATE, burst: int = REQUEST_BURST) -> None:
+        """Initialize the scheduler."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled = monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._busy = False
+        self._current: tuple[int, asyncio.Task] | None = None
+        self._preempted: asyncio.Task | None = None
+        self.waits = HacsBobilHistogram()
+        self.preemptions = 0
+        self._flight: asyncio.Future[Any] | None = None
+        self._flight_result: tuple[float, Any] | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for their turn."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def async_run[T](
+        self, priority: int, request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run `request` once it is its turn, retrying it if preempted."""
+        while True:
+            queued = monotonic()
+            await self._async_acquire(priority)
+            try:
+                self._record_wait(monotonic() - queued)
+                await self._async_throttle()
+                task = asyncio.ensure_future(request())
+                self._current = (priority, task)
+                try:
+                    return await task
+                except asyncio.CancelledError:
+                    if self._preempted is not task:
+                        raise
+                    LOGGER.debug("Request preempted by a command, re-queueing")
+            finally:
+                self._current = None
+                self._preempted = None
+                self._release()
+
+    async def async_single_flight[T](
+        self, request: Callable[[], Awaitable[T]], max_age: float = 0
+    ) -> T:
+        """
+        Run `request` once for all concurrent callers.
+
+        Callers arriving while it is in flight share its outcome, and a result
+        younger than `max_age` seconds is returned without running it again.
+        """
+        if (cached := self._flight_result) is not None and (
+            monotonic() - cached[0] <= max_age
+        ):
+            return cached[1]
+        if self._flight is None:
+            self._flight = asyncio.ensure_future(request())
+            self._flight.add_done_callback(self._flight_done)
+        # One caller giving up must not cancel the fetch for the others.
+        return await asyncio.shield(self._flight)
+
+    def _flight_done(self, flight: asyncio.Future[Any]) -> None:
+        """Keep the result of a finished flight for later callers."""
+        self._flight = None
+        if not flight.cancelled() and flight.exception() is None:
+            self._flight_result = (monotonic(), flight.result())
+
+    def invalidate(self) -> None:
+        """Forget the last shared result, e.g. after the state was changed."""
+        self._flight_result = None
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait until this request holds the connection."""
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        self._maybe_preempt(priority)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _maybe_preempt(self, priority: int) -> None:
+        """Cancel an in-flight request of lower priority."""
+        if self._current is None or self._preempted is not None:
+            return
+        current_priority, task = self._current
+        if current_priority > priority and not task.done():
+            self._preempted = task
+            self.preemptions += 1
+            task.cancel()
+
+    def _release(self) -> None:
+        """Hand the connection to the next waiter, if any."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
+
+    async def _async_throttle(self) -> None:
+        """Wait for a token so bursts stay within the configured rate."""
+        now = monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._refilled) * self._rate
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+            self._tokens = 1.0
+            self._refilled = monotonic()
+        self._tokens -= 1
+
+    def _record_wait(self, wait: float) -> None:
+        """Keep track of how long requests queue for."""
+        self.waits.record(wait)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import attrgetter
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,72 +14,362 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 
+from .const import (
+    ATTR_WINDOW_MAX,
+    ATTR_WINDOW_MIN,
+    LAST_UPDATE_MIN_INTERVAL,
+    RUNTIME_CONTEXT,
+    RUNTIME_MIN_INTERVAL,
+    SENSOR_HEARTBEAT,
+    STATISTICS_PERIOD,
+    TREND_MIN_INTERVAL,
+)
 from .entity import HacsBobilEntity
+from .fields import PAGE_FIELDS
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Callable
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
+    from .api import HacsBobilApiClient
     from .coordinator import BlueprintDataUpdateCoordinator
-    from .data import HacsBobilConfigEntry
+    from .data import HacsBobilConfigEntry, HacsBobilSnapshot
+    from .history import HacsBobilHistory
+    from .runtime import HacsBobilRuntime
+
+# Diagnostic sensors read counters that change on every poll, so unlike the
+# coordinator-driven sensors they are polled on their own schedule.
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HacsBobilDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a hacs_bobil performance sensor."""
+
+    value_fn: Callable[[HacsBobilApiClient], StateType]
+    entity_category: EntityCategory = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class HacsBobilSensorEntityDescription(SensorEntityDescription):
+    """
+    Describes a hacs_bobil sensor and how its state writes are filtered.
+
+    A new value is held back while it is within `deadband` of the last
+    written one or less than `min_interval` seconds after the last write, and
+    written anyway once `heartbeat` seconds have passed.
+
+    In statistics mode, readings flagged with `statistics` lose their state
+    class, so the recorder does not compile statistics from their states as
+    well, and are written at most once per statistics period.
+    """
+
+    deadband: float = 0
+    min_interval: float = 0
+    heartbeat: float = SENSOR_HEARTBEAT
+    # Whether statistics mode aggregates this reading instead of the recorder
+    statistics: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class HacsBobilTrendSensorEntityDescription(HacsBobilSensorEntityDescription):
+    """Describes a hacs_bobil sensor derived from the reading history."""
+
+    source: str
+    value_fn: Callable[[HacsBobilHistory, HacsBobilSnapshot], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HacsBobilRuntimeSensorEntityDescription(HacsBobilSensorEntityDescription):
+    """Describes a hacs_bobil heater on-time, cycle or duty cycle sensor."""
+
+    value_fn: Callable[[HacsBobilRuntime], StateType]
+    min_interval: float = RUNTIME_MIN_INTERVAL
+
+
+def _per_minute(history: HacsBobilHistory, key: str) -> float | None:
+    """Return the rate of change of `key` per minute."""
+    slope = history[key].slope
+    return None if slope is None else round(slope * 60, 3)
+
+
+def _minutes_to_target(
+    history: HacsBobilHistory, data: HacsBobilSnapshot
+) -> float | None:
+    """Return the minutes until the air reaches its target at the current rate."""
+    current, target = data.air_temperature, data.air_temperature_target
+    slope = history["air_temperature"].slope
+    if current is None or target is None:
+        return None
+    if current >= target:
+        return 0.0
+    if slope is None or slope <= 0:
+        return None
+    return round((target - current) / slope / 60, 1)
+
+
+def _minutes_to_empty(
+    history: HacsBobilHistory, data: HacsBobilSnapshot
+) -> float | None:
+    """Return the minutes until the water tank is empty at the current rate."""
+    slope = history["water_level"].slope
+    if data.water_level is None or slope is None or slope >= 0:
+        return None
+    return round(data.water_level / -slope / 60)
+
 
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
-        key="air_temperature",
-        name="Air Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
+    *(
+        HacsBobilSensorEntityDescription(
+            key=field.key,
+            name=field.name,
+            icon=field.icon,
+            native_unit_of_measurement=field.unit,
+            device_class=field.device_class and SensorDeviceClass(field.device_class),
+            state_class=field.state_class and SensorStateClass(field.state_class),
+            entity_registry_enabled_default=field.enabled_default,
+            deadband=field.deadband,
+            min_interval=field.min_interval,
+            statistics=field.statistics,
+        )
+        for field in PAGE_FIELDS
+        if field.platform == Platform.SENSOR
+    ),
+    HacsBobilSensorEntityDescription(
+        key="heating_mode",
+        name="Heating Mode",
+        icon="mdi:fire",
+    ),
+    HacsBobilSensorEntityDescription(
+        key="last_update",
+        name="Last Update",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock-check-outline",
+        min_interval=LAST_UPDATE_MIN_INTERVAL,
+    ),
+)
+
+_DURATION = {
+    "native_unit_of_measurement": UnitOfTime.MILLISECONDS,
+    "device_class": SensorDeviceClass.DURATION,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "suggested_display_precision": 1,
+}
+
+DIAGNOSTIC_ENTITY_DESCRIPTIONS = (
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="poll_latency",
+        name="Poll Latency",
+        icon="mdi:timer-outline",
+        value_fn=lambda client: _ms(client.stats.request.last),
+        **_DURATION,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll Latency 95th Percentile",
+        icon="mdi:timer-alert-outline",
+        value_fn=lambda client: _ms(client.stats.request.percentile(0.95)),
+        **_DURATION,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="time_to_first_byte",
+        name="Time To First Byte",
+        icon="mdi:timer-outline",
+        value_fn=lambda client: _ms(client.stats.first_byte.last),
+        **_DURATION,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="parse_time",
+        name="Parse Time",
+        icon="mdi:code-tags",
+        value_fn=lambda client: _ms(client.stats.parse.last),
+        **{**_DURATION, "suggested_display_precision": 3},
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="response_size",
+        name="Response Size",
+        icon="mdi:file-document-outline",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:thermometer",
+        value_fn=lambda client: client.stats.response_bytes,
     ),
-    SensorEntityDescription(
-        key="air_temperature_target",
-        name="Air Temperature Target",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        icon="mdi:thermometer-chevron-up",
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="request_errors",
+        name="Request Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client: client.stats.error_count,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="request_timeouts",
+        name="Request Timeouts",
+        icon="mdi:timer-off-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client: client.stats.timeouts,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="command_round_trip",
+        name="Command Round Trip",
+        icon="mdi:swap-horizontal",
+        value_fn=lambda client: _ms(client.stats.command.last),
+        **_DURATION,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="command_confirm_time",
+        name="Command Confirm Time",
+        icon="mdi:check-circle-outline",
+        value_fn=lambda client: _ms(client.stats.confirm.last),
+        **_DURATION,
+    ),
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="queue_wait",
+        name="Request Queue Wait",
+        icon="mdi:tray-full",
+        value_fn=lambda client: _ms(client.scheduler.waits.last),
+        **_DURATION,
     ),
-    SensorEntityDescription(
-        key="water_tank_temperature",
-        name="Water Tank Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="queue_depth",
+        name="Request Queue Depth",
+        icon="mdi:tray",
         state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:water-thermometer",
+        value_fn=lambda client: client.scheduler.queue_depth,
     ),
-    SensorEntityDescription(
-        key="water_level",
-        name="Water Level",
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:water-percent",
+    HacsBobilDiagnosticSensorEntityDescription(
+        key="suppressed_writes",
+        name="Suppressed State Writes",
+        icon="mdi:database-minus-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda client: client.stats.suppressed_writes,
+    ),
+)
+
+
+TREND_ENTITY_DESCRIPTIONS = (
+    HacsBobilTrendSensorEntityDescription(
+        key="air_temperature_rate",
+        name="Air Temperature Rate",
+        icon="mdi:thermometer-chevron-up",
+        native_unit_of_measurement=f"{UnitOfTemperature.CELSIUS}/min",
         state_class=SensorStateClass.MEASUREMENT,
+        source="air_temperature",
+        min_interval=TREND_MIN_INTERVAL,
+        value_fn=lambda history, _: _per_minute(history, "air_temperature"),
     ),
-    SensorEntityDescription(
-        key="system_number",
-        name="System Number",
-        icon="mdi:identifier",
+    HacsBobilTrendSensorEntityDescription(
+        key="water_tank_temperature_rate",
+        name="Water Tank Temperature Rate",
+        icon="mdi:water-thermometer",
+        native_unit_of_measurement=f"{UnitOfTemperature.CELSIUS}/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        source="water_tank_temperature",
+        min_interval=TREND_MIN_INTERVAL,
+        value_fn=lambda history, _: _per_minute(history, "water_tank_temperature"),
     ),
-    SensorEntityDescription(
-        key="van_heating_status",
-        name="Van Heating Status",
-        icon="mdi:radiator",
+    HacsBobilTrendSensorEntityDescription(
+        key="water_level_rate",
+        name="Water Level Rate",
+        icon="mdi:water-percent",
+        native_unit_of_measurement=f"{PERCENTAGE}/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        source="water_level",
+        min_interval=TREND_MIN_INTERVAL,
+        value_fn=lambda history, _: _per_minute(history, "water_level"),
     ),
-    SensorEntityDescription(
-        key="heating_mode",
-        name="Heating Mode",
-        icon="mdi:fire",
+    HacsBobilTrendSensorEntityDescription(
+        key="air_temperature_time_to_target",
+        name="Air Temperature Time To Target",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        source="air_temperature",
+        min_interval=TREND_MIN_INTERVAL,
+        value_fn=_minutes_to_target,
     ),
-    SensorEntityDescription(
-        key="last_update",
-        name="Last Update",
-        device_class=SensorDeviceClass.TIMESTAMP,
-        icon="mdi:clock-check-outline",
+    HacsBobilTrendSensorEntityDescription(
+        key="water_level_time_to_empty",
+        name="Water Level Time To Empty",
+        icon="mdi:timer-sand-empty",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        source="water_level",
+        min_interval=TREND_MIN_INTERVAL,
+        value_fn=_minutes_to_empty,
     ),
 )
 
 
+def _runtime_descriptions(
+    key: str, name: str
+) -> tuple[HacsBobilRuntimeSensorEntityDescription, ...]:
+    """Return the runtime sensors of the heating mode with status field `key`."""
+    mode = key.removesuffix("_status")
+    return (
+        HacsBobilRuntimeSensorEntityDescription(
+            key=f"{mode}_runtime",
+            name=f"{name} Runtime",
+            icon="mdi:timer-outline",
+            native_unit_of_measurement=UnitOfTime.HOURS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=2,
+            value_fn=lambda runtime: round(runtime.total[key] / 3600, 4),
+        ),
+        HacsBobilRuntimeSensorEntityDescription(
+            key=f"{mode}_cycles",
+            name=f"{name} Cycles",
+            icon="mdi:counter",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=lambda runtime: runtime.cycles[key],
+        ),
+        HacsBobilRuntimeSensorEntityDescription(
+            key=f"{mode}_duty_cycle_today",
+            name=f"{name} Duty Cycle Today",
+            icon="mdi:percent-circle-outline",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda runtime: runtime.duty_cycle_today(key),
+        ),
+        HacsBobilRuntimeSensorEntityDescription(
+            key=f"{mode}_duty_cycle",
+            name=f"{name} Duty Cycle",
+            icon="mdi:percent-circle",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda runtime: runtime.duty_cycle_window(key),
+        ),
+    )
+
+
+RUNTIME_ENTITY_DESCRIPTIONS = tuple(
+    description
+    for field in PAGE_FIELDS
+    if field.runtime
+    for description in _runtime_descriptions(field.key, field.name)
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: HacsBobilConfigEntry,
@@ -90,39 +383,251 @@ async def async_setup_entry(
         )
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        HacsBobilTrendSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in TREND_ENTITY_DESCRIPTIONS
+    )
+    async_add_entities(
+        HacsBobilRuntimeSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in RUNTIME_ENTITY_DESCRIPTIONS
+    )
+    async_add_entities(
+        HacsBobilDiagnosticSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in DIAGNOSTIC_ENTITY_DESCRIPTIONS
+    )
+
+
+class HacsBobilFilteredSensor(HacsBobilEntity, SensorEntity):
+    """
+    Base of the coordinator-driven sensors that filters state writes.
+
+    Held-back values are counted in the client stats and written by a timer
+    once the minimum interval or the heartbeat has passed, so the latest value
+    always ends up in the state machine. Availability and stale changes are
+    always written straight away.
+    """
+
+    entity_description: HacsBobilSensorEntityDescription
+    _written_value: Any = None
+    _written_flags: tuple[bool, bool] | None = None
+    _written_at = float("-inf")
+    _pending_write: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel a held-back write when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_pending_write)
+
+    @property
+    def state_class(self) -> SensorStateClass | str | None:
+        """Leave statistics to the coordinator in statistics mode."""
+        if self._in_statistics_mode:
+            return None
+        return super().state_class
+
+    @property
+    def _in_statistics_mode(self) -> bool:
+        """Return whether the coordinator aggregates this reading."""
+        return (
+            self.entity_description.statistics
+            and self.coordinator.statistics is not None
+        )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state unless the filter holds it back."""
+        if (delay := self._hold_back_for()) is None:
+            self._async_write_filtered()
+            return
+        self.coordinator.config_entry.runtime_data.client.stats.suppressed_writes += 1
+        if self._pending_write is None:
+            self._pending_write = async_call_later(
+                self.hass, delay, self._async_write_pending
+            )
 
-class HacsBobilSensor(HacsBobilEntity, SensorEntity):
+    def _hold_back_for(self) -> float | None:
+        """Return the seconds to hold back the current value, or None."""
+        description = self.entity_description
+        if (self.available, self.coordinator.stale) != self._written_flags:
+            return None
+        elapsed = monotonic() - self._written_at
+        if elapsed >= description.heartbeat:
+            return None
+        min_interval = description.min_interval
+        if self._in_statistics_mode:
+            min_interval = max(min_interval, STATISTICS_PERIOD)
+        if elapsed < min_interval:
+            return min_interval - elapsed
+        value, written = self.native_value, self._written_value
+        if (
+            description.deadband
+            and isinstance(value, float | int)
+            and isinstance(written, float | int)
+            and abs(value - written) < description.deadband
+        ):
+            return description.heartbeat - elapsed
+        return None
+
+    @callback
+    def _async_write_pending(self, _: datetime) -> None:
+        """
+        Write the value held back by the filter, if it still passes.
+
+        A value held back for the minimum interval may still be within the
+        deadband of the last write; it then waits for the heartbeat instead.
+        """
+        self._pending_write = None
+        if (delay := self._hold_back_for()) is not None:
+            self._pending_write = async_call_later(
+                self.hass, delay, self._async_write_pending
+            )
+            return
+        self._async_write_filtered()
+
+    @callback
+    def _async_write_filtered(self) -> None:
+        """Write the state and remember what was written."""
+        self._async_cancel_pending_write()
+        self._written_value = self.native_value
+        self._written_flags = (self.available, self.coordinator.stale)
+        self._written_at = monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        """Cancel the timer of a held-back write."""
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+
+
+class HacsBobilSensor(HacsBobilFilteredSensor):
     """hacs_bobil Sensor class."""
 
     def __init__(
         self,
         coordinator: BlueprintDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: HacsBobilSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (entity_description.key,))
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        self._value = attrgetter(entity_description.key)
 
     @property
     def native_value(self) -> str | float | datetime | None:
         """Return the native value of the sensor."""
-        # Special handling for heating_mode sensor
-        if self.entity_description.key == "heating_mode":
-            return self._get_heating_mode()
-        return self.coordinator.data.get(self.entity_description.key)
-
-    def _get_heating_mode(self) -> str:
-        """Determine the heating mode based on individual heating statuses."""
-        combined = self.coordinator.data.get("combined_heating_status", False)
-        air = self.coordinator.data.get("air_heating_status", False)
-        water = self.coordinator.data.get("water_heating_status", False)
-
-        if combined or (air and water):
-            return "BOTH"
-        if air:
-            return "AIR"
-        if water:
-            return "WATER"
-        return "OFF"
+        return self._value(self.coordinator.data)
+
+
+class HacsBobilTrendSensor(HacsBobilFilteredSensor):
+    """
+    hacs_bobil sensor derived from the reading history.
+
+    Trends move with every new sample, so these sensors are written whenever
+    any reading changes. The window minimum and maximum of the source reading
+    are exposed as attributes.
+    """
+
+    entity_description: HacsBobilTrendSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        entity_description: HacsBobilTrendSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, ("last_update", entity_description.source))
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(
+            self.coordinator.history, self.coordinator.data
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the window minimum and maximum of the source reading."""
+        window = self.coordinator.history[self.entity_description.source]
+        return {
+            **(super().extra_state_attributes or {}),
+            ATTR_WINDOW_MIN: window.minimum,
+            ATTR_WINDOW_MAX: window.maximum,
+        }
+
+
+class HacsBobilRuntimeSensor(HacsBobilFilteredSensor):
+    """
+    hacs_bobil heater on-time, cycle or duty cycle sensor.
+
+    The counters move with every poll, so the coordinator calls these
+    sensors after every poll, even one that returned an unchanged page, and
+    they are written at most once a minute.
+    """
+
+    entity_description: HacsBobilRuntimeSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        entity_description: HacsBobilRuntimeSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, (RUNTIME_CONTEXT,))
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.runtime)
+
+
+class HacsBobilDiagnosticSensor(HacsBobilEntity, SensorEntity):
+    """hacs_bobil performance sensor class."""
+
+    entity_description: HacsBobilDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        entity_description: HacsBobilDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll the counters instead of waiting for a data change."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the counters at state write time; there is nothing to fetch."""
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(
+            self.coordinator.config_entry.runtime_data.client
+        )
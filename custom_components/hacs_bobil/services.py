@@ -0,0 +1,107 @@
+"""Services for hacs_bobil."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util.json import load_json
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FILE,
+    ATTR_SPEED,
+    DOMAIN,
+    SERVICE_APPLY_STATE,
+    SERVICE_REPLAY,
+)
+from .fields import SERVICE_FIELDS
+from .trace import HacsBobilTrace
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .data import HacsBobilConfigEntry
+
+APPLY_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        **{vol.Optional(field): cv.boolean for field in SERVICE_FIELDS},
+        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+    }
+)
+
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(ATTR_SPEED, default=1.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    def _loaded_entry(call: ServiceCall) -> HacsBobilConfigEntry:
+        """Return the loaded config entry a service call is for."""
+        entry: HacsBobilConfigEntry | None = hass.config_entries.async_get_entry(
+            call.data[ATTR_CONFIG_ENTRY_ID]
+        )
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            msg = f"Heating system {call.data[ATTR_CONFIG_ENTRY_ID]} is not loaded"
+            raise ServiceValidationError(msg)
+        return entry
+
+    async def async_apply_state(call: ServiceCall) -> None:
+        """Apply the requested heating modes and target temperature."""
+        entry = _loaded_entry(call)
+        await entry.runtime_data.coordinator.async_apply_state(
+            {
+                status: call.data[field]
+                for field, status in SERVICE_FIELDS.items()
+                if field in call.data
+            },
+            call.data.get(ATTR_TEMPERATURE),
+        )
+
+    async def async_replay(call: ServiceCall) -> ServiceResponse:
+        """Replay a captured trace from a diagnostics download."""
+        entry = _loaded_entry(call)
+        path = call.data[ATTR_FILE]
+        if not hass.config.is_allowed_path(path):
+            msg = f"Access to {path} is not allowed"
+            raise ServiceValidationError(msg)
+        try:
+            download: Any = await hass.async_add_executor_job(load_json, path)
+            # A whole diagnostics download, or just its data.
+            data = download.get("data", download)
+            events = HacsBobilTrace.events_from_dict(data["trace"])
+        except (HomeAssistantError, AttributeError, KeyError, TypeError) as exception:
+            msg = f"No captured trace found in {path}"
+            raise ServiceValidationError(msg) from exception
+        return await entry.runtime_data.coordinator.async_replay(
+            events, call.data[ATTR_SPEED]
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_STATE, async_apply_state, schema=APPLY_STATE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        async_replay,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
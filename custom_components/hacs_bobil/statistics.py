@@ -0,0 +1,121 @@
+"""Long-term statistics aggregated in memory for hacs_bobil."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+
+from .const import DOMAIN, LOGGER, STATISTICS_PERIOD
+from .fields import STATISTICS_FIELDS
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import HacsBobilConfigEntry, HacsBobilSnapshot
+
+
+class _Bucket:
+    """Running mean, minimum and maximum of one period."""
+
+    __slots__ = ("count", "maximum", "minimum", "total")
+
+    def __init__(self, value: float) -> None:
+        """Initialize the bucket with its first value."""
+        self.count = 1
+        self.total = self.minimum = self.maximum = value
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+
+class HacsBobilStatistics:
+    """
+    Aggregate readings into statistics without going through state history.
+
+    Readings are folded into 5-minute buckets as they arrive. The recorder
+    only accepts external statistics for whole hours, so once an hour is over
+    its buckets are combined into one hourly mean, minimum and maximum and
+    imported. The mean weighs every 5-minute bucket equally, which makes it
+    time-weighted like the statistics the recorder compiles from states.
+    Memory use is bounded by the twelve buckets of the current hour.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: HacsBobilConfigEntry) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._entry = entry
+        self._hour: datetime | None = None
+        self._period: datetime | None = None
+        self._current: dict[str, _Bucket] = {}
+        self._closed: dict[str, list[_Bucket]] = {key: [] for key in STATISTICS_FIELDS}
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic id of `key`."""
+        return f"{DOMAIN}:{self._entry.entry_id.lower()}_{key}"
+
+    def add(self, now: datetime, snapshot: HacsBobilSnapshot) -> None:
+        """Add the readings of `snapshot`, taken at `now`."""
+        period = now.replace(
+            minute=now.minute - now.minute % (STATISTICS_PERIOD // 60),
+            second=0,
+            microsecond=0,
+        )
+        if period != self._period:
+            self._close_period()
+            self._period = period
+        hour = period.replace(minute=0)
+        if hour != self._hour:
+            if self._hour is not None:
+                self._async_import_hour(self._hour)
+            self._hour = hour
+        for key in STATISTICS_FIELDS:
+            if (value := getattr(snapshot, key)) is None:
+                continue
+            if (bucket := self._current.get(key)) is None:
+                self._current[key] = _Bucket(value)
+            else:
+                bucket.add(value)
+
+    def _close_period(self) -> None:
+        """Move the buckets of the current period to the hour."""
+        for key, bucket in self._current.items():
+            self._closed[key].append(bucket)
+        self._current = {}
+
+    def _async_import_hour(self, hour: datetime) -> None:
+        """Import the statistics of a finished hour and start a new one."""
+        if "recorder" not in self._hass.config.components:
+            LOGGER.debug("Recorder not loaded, dropping statistics for %s", hour)
+            self._closed = {key: [] for key in STATISTICS_FIELDS}
+            return
+        for key, (name, unit) in STATISTICS_FIELDS.items():
+            buckets, self._closed[key] = self._closed[key], []
+            if not buckets:
+                continue
+            statistic = StatisticData(
+                start=hour,
+                mean=sum(bucket.total / bucket.count for bucket in buckets)
+                / len(buckets),
+                min=min(bucket.minimum for bucket in buckets),
+                max=max(bucket.maximum for bucket in buckets),
+            )
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self._entry.title} {name}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_of_measurement=unit,
+            )
+            LOGGER.debug("Importing %s for %s", key, hour)
+            async_add_external_statistics(self._hass, metadata, [statistic])
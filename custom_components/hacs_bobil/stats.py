@@ -0,0 +1,140 @@
+"""Fixed-size performance counters for hacs_bobil."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bucket bounds, in seconds, of every latency histogram
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Distinct exception classes counted by name; the rest count as "other"
+MAX_ERROR_KINDS = 16
+
+
+class HacsBobilHistogram:
+    """Latency histogram over fixed buckets, plus count, sum, max and last."""
+
+    __slots__ = ("buckets", "count", "last", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean observation."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, hits in zip(LATENCY_BUCKETS, self.buckets, strict=False):
+            seen += hits
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for the diagnostics download."""
+        return {
+            "count": self.count,
+            "last": self.last,
+            "mean": self.mean,
+            "p95": self.percentile(0.95),
+            "max": self.max,
+            "buckets": dict(
+                zip(
+                    [*(str(bound) for bound in LATENCY_BUCKETS), "inf"],
+                    self.buckets,
+                    strict=True,
+                )
+            ),
+        }
+
+
+class HacsBobilStats:
+    """Request, parse, entity update, command, error and state write counters."""
+
+    __slots__ = (
+        "command",
+        "confirm",
+        "errors",
+        "first_byte",
+        "listeners",
+        "parse",
+        "request",
+        "response_bytes",
+        "suppressed_writes",
+        "timeouts",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.request = HacsBobilHistogram()
+        self.first_byte = HacsBobilHistogram()
+        self.parse = HacsBobilHistogram()
+        self.listeners = HacsBobilHistogram()
+        self.command = HacsBobilHistogram()
+        self.confirm = HacsBobilHistogram()
+        self.response_bytes: int | None = None
+        self.timeouts = 0
+        self.errors: dict[str, int] = {}
+        self.suppressed_writes = 0
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    def record_error(self, exception: BaseException) -> None:
+        """Count a failed request by exception class."""
+        if isinstance(exception, TimeoutError):
+            self.timeouts += 1
+        kind = type(exception).__name__
+        if kind not in self.errors and len(self.errors) >= MAX_ERROR_KINDS:
+            kind = "other"
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for the diagnostics download."""
+        return {
+            "request": self.request.as_dict(),
+            "first_byte": self.first_byte.as_dict(),
+            "parse": self.parse.as_dict(),
+            "listeners": self.listeners.as_dict(),
+            "command": self.command.as_dict(),
+            "confirm": self.confirm.as_dict(),
+            "response_bytes": self.response_bytes,
+            "timeouts": self.timeouts,
+            "errors": dict(self.errors),
+            "suppressed_writes": self.suppressed_writes,
+        }
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 
 from .entity import HacsBobilEntity
+from .fields import PAGE_FIELDS, STATUS_ENDPOINTS
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -16,22 +18,15 @@ if TYPE_CHECKING:
     from .coordinator import BlueprintDataUpdateCoordinator
     from .data import HacsBobilConfigEntry
 
-ENTITY_DESCRIPTIONS = (
+# A switch for each status that can be switched, keyed by the mode it controls
+ENTITY_DESCRIPTIONS = tuple(
     SwitchEntityDescription(
-        key="air_heating",
-        name="Air Heating",
-        icon="mdi:radiator",
-    ),
-    SwitchEntityDescription(
-        key="water_heating",
-        name="Water Heating",
-        icon="mdi:water-boiler",
-    ),
-    SwitchEntityDescription(
-        key="combined_heating",
-        name="Combined Heating",
-        icon="mdi:fire",
-    ),
+        key=field.key.removesuffix("_status"),
+        name=field.name,
+        icon=field.icon,
+    )
+    for field in PAGE_FIELDS
+    if field.endpoints
 )
 
 
@@ -59,36 +54,30 @@ class HacsBobilSwitch(HacsBobilEntity, SwitchEntity):
         entity_description: SwitchEntityDescription,
     ) -> None:
         """Initialize the switch class."""
-        super().__init__(coordinator)
+        self._status_key = f"{entity_description.key}_status"
+        super().__init__(coordinator, (self._status_key,))
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        self._is_on = attrgetter(self._status_key)
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        status_key = f"{self.entity_description.key}_status"
-        return self.coordinator.data.get(status_key, False)
+        return bool(self._is_on(self.coordinator.data))
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the switch."""
-        client = self.coordinator.config_entry.runtime_data.client
-        if self.entity_description.key == "air_heating":
-            await client.async_turn_on_air_heating()
-        elif self.entity_description.key == "water_heating":
-            await client.async_turn_on_water_heating()
-        elif self.entity_description.key == "combined_heating":
-            await client.async_turn_on_combined_heating()
-        await asyncio.sleep(2)
-        await self.coordinator.async_request_refresh()
+        await self._async_switch(on=True)
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the switch."""
+        await self._async_switch(on=False)
+
+    async def _async_switch(self, *, on: bool) -> None:
+        """Send the on or off command and wait for the page to confirm it."""
         client = self.coordinator.config_entry.runtime_data.client
-        if self.entity_description.key == "air_heating":
-            await client.async_turn_off_air_heating()
-        elif self.entity_description.key == "water_heating":
-            await client.async_turn_off_water_heating()
-        elif self.entity_description.key == "combined_heating":
-            await client.async_turn_off_combined_heating()
-        await asyncio.sleep(2)
-        await self.coordinator.async_request_refresh()
+        endpoint = STATUS_ENDPOINTS[self._status_key][0 if on else 1]
+        await self.coordinator.async_send_command(
+            partial(client.async_send_commands, (endpoint,)),
+            expected={self._status_key: on},
+        )
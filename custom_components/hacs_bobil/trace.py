@@ -0,0 +1,157 @@
+"""Capture and replay of controller traffic for hacs_bobil."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from .const import TRACE_SIZE
+from .transport import HacsBobilTransportError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Path of the page; every other path is a command
+PAGE_PATH = "/"
+
+
+@dataclass(frozen=True, slots=True)
+class HacsBobilTraceEvent:
+    """
+    One request to the controller.
+
+    `time` is in seconds since the capture started. A request that failed has
+    its error, as "ExceptionClass: message", instead of a body; commands have
+    no body either.
+    """
+
+    time: float
+    path: str
+    latency: float | None = None
+    body: bytes | None = None
+    error: str | None = None
+
+
+class HacsBobilTrace:
+    """
+    Ring buffer of the most recent requests to one controller.
+
+    Consecutive polls mostly return the same page, so an unchanged body is
+    stored as a reference to the previous one and, in the export, as null.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize the trace."""
+        self.events: deque[HacsBobilTraceEvent] = deque(maxlen=size)
+        self.dropped = 0
+        self._started = monotonic()
+        self._last_body: bytes | None = None
+
+    def record(
+        self,
+        path: str,
+        latency: float | None = None,
+        body: bytes | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        """Add one request, dropping the oldest once the buffer is full."""
+        if body is not None and body == self._last_body:
+            body = self._last_body
+        elif body is not None:
+            self._last_body = body
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(
+            HacsBobilTraceEvent(
+                time=monotonic() - self._started,
+                path=path,
+                latency=latency,
+                body=body,
+                error=exception and f"{type(exception).__name__}: {exception}",
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace for the diagnostics download."""
+        events = []
+        previous: bytes | None = None
+        for event in self.events:
+            body = event.body
+            if body is not None:
+                body, previous = (None if body == previous else body), body
+            events.append(
+                {
+                    "time": round(event.time, 4),
+                    "path": event.path,
+                    "latency": event.latency and round(event.latency, 4),
+                    # Latin-1 maps every byte to one character and back.
+                    "body": body and body.decode("latin-1"),
+                    "error": event.error,
+                }
+            )
+        return {"dropped": self.dropped, "events": events}
+
+    @staticmethod
+    def events_from_dict(data: dict[str, Any]) -> list[HacsBobilTraceEvent]:
+        """Return the events of a trace exported with `as_dict`."""
+        events = []
+        previous: bytes | None = None
+        for event in data["events"]:
+            body = None
+            if event["path"] == PAGE_PATH and event["error"] is None:
+                body = previous = (
+                    previous
+                    if event["body"] is None
+                    else event["body"].encode("latin-1")
+                )
+            events.append(
+                HacsBobilTraceEvent(
+                    time=event["time"],
+                    path=event["path"],
+                    latency=event["latency"],
+                    body=body,
+                    error=event["error"],
+                )
+            )
+        return events
+
+
+class HacsBobilReplayTransport:
+    """
+    Serve recorded polls in place of the controller.
+
+    Has the same interface as `HacsBobilRawTransport`. Every page request
+    returns the poll at `cursor`, after its recorded latency divided by
+    `speed`, or raises its recorded error. Commands succeed without effect,
+    since the recorded pages already show what they did.
+    """
+
+    def __init__(self, polls: Iterable[HacsBobilTraceEvent], speed: float) -> None:
+        """Initialize the transport; a `speed` of 0 skips all waiting."""
+        self.polls = list(polls)
+        self.speed = speed
+        self.cursor = 0
+        self.first_byte: float | None = None
+
+    async def async_get(
+        self,
+        path: str,
+        connect_timeout: float,  # noqa: ARG002
+        until: Callable[[bytearray, int, int], int | None] | None = None,  # noqa: ARG002
+    ) -> bytes:
+        """Return the current recorded page."""
+        if path != PAGE_PATH:
+            return b""
+        event = self.polls[self.cursor]
+        if self.speed and event.latency:
+            await asyncio.sleep(event.latency / self.speed)
+        self.first_byte = event.latency
+        if event.error is not None:
+            kind, _, message = event.error.partition(": ")
+            if kind == TimeoutError.__name__:
+                raise TimeoutError(message)
+            raise HacsBobilTransportError(event.error)
+        return event.body or b""
@@ -0,0 +1,202 @@
+"""Minimal HTTP/1.0 transport for talking to the controller."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import async_timeout
+
+from .const import RAW_BUFFER_SIZE, RAW_MAX_HEAD
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_HEAD_END = b"\r\n\r\n"
+_LINE_END = b"\r\n"
+
+
+class HacsBobilTransportError(Exception):
+    """Exception to indicate a malformed or unsuccessful HTTP response."""
+
+
+class HacsBobilTruncatedBodyError(HacsBobilTransportError):
+    """Exception to indicate the connection closed part way through the body."""
+
+    def __init__(self, body: bytes) -> None:
+        """Keep what was received of the body."""
+        super().__init__(f"Response body cut off after {len(body)} bytes")
+        self.body = body
+
+
+class _ResponseProtocol(asyncio.BufferedProtocol):
+    """
+    Receive one HTTP response straight into a caller-owned buffer.
+
+    The buffer is doubled when full and never shrunk, so after the first few
+    requests a page is received without any allocation. The status line and
+    headers are checked in place; only the body is copied out.
+    """
+
+    def __init__(
+        self,
+        buffer: bytearray,
+        done: asyncio.Future[bytes],
+        until: Callable[[bytearray, int, int], int | None] | None,
+    ) -> None:
+        """Initialize the protocol."""
+        self.buffer = buffer
+        self._done = done
+        self._until = until
+        self._used = 0
+        self._body = -1
+        self._end: int | None = None
+        self.first_byte: float | None = None
+
+    def get_buffer(self, sizehint: int) -> memoryview:  # noqa: ARG002
+        """Return the free tail of the buffer, growing it when full."""
+        if self._used == len(self.buffer):
+            self.buffer.extend(bytes(len(self.buffer)))
+        return memoryview(self.buffer)[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Look at newly received bytes."""
+        if self._done.done():
+            return
+        if self.first_byte is None:
+            self.first_byte = monotonic()
+        head_from = max(self._used - len(_HEAD_END) + 1, 0)
+        self._used += nbytes
+        try:
+            if self._body < 0 and not self._parse_head(head_from):
+                return
+        except HacsBobilTransportError as exception:
+            self._done.set_exception(exception)
+            return
+        available = self._used if self._end is None else min(self._used, self._end)
+        if (
+            self._until is not None
+            and (stop := self._until(self.buffer, self._body, available)) is not None
+        ):
+            self._finish(stop)
+        elif self._end is not None and self._used >= self._end:
+            self._finish(self._end)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Settle the response once the server has closed the connection."""
+        if self._done.done():
+            return
+        if exc is not None:
+            self._done.set_exception(exc)
+        elif self._body < 0:
+            self._done.set_exception(
+                HacsBobilTransportError("Connection closed before the response")
+            )
+        elif self._end is not None and self._used < self._end:
+            self._done.set_exception(
+                HacsBobilTruncatedBodyError(self._copy(self._used))
+            )
+        else:
+            self._finish(self._used)
+
+    def _parse_head(self, search_from: int) -> bool:
+        """Check the status line and headers once they are complete."""
+        buffer = self.buffer
+        head_end = buffer.find(_HEAD_END, search_from, self._used)
+        if head_end < 0:
+            if self._used > RAW_MAX_HEAD:
+                msg = "Response headers too long"
+                raise HacsBobilTransportError(msg)
+            return False
+        status_end = buffer.find(_LINE_END, 0, head_end)
+        if status_end < 0:
+            status_end = head_end
+        # "HTTP/1.x 200 OK"
+        status = buffer[9:12]
+        if not buffer.startswith(b"HTTP/1.") or not status.isdigit():
+            msg = "Malformed status line"
+            raise HacsBobilTransportError(msg)
+        if int(status) >= 400:  # noqa: PLR2004
+            reason = buffer[13:status_end].decode(errors="replace")
+            msg = f"{int(status)}, message='{reason}'"
+            raise HacsBobilTransportError(msg)
+        for line in buffer[status_end + 2 : head_end].split(_LINE_END):
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                try:
+                    self._end = head_end + len(_HEAD_END) + int(value)
+                except ValueError as exception:
+                    msg = "Malformed Content-Length"
+                    raise HacsBobilTransportError(msg) from exception
+            elif name == b"transfer-encoding" and value.strip().lower() != b"identity":
+                msg = "Unsupported transfer encoding"
+                raise HacsBobilTransportError(msg)
+        self._body = head_end + len(_HEAD_END)
+        return True
+
+    def _finish(self, stop: int) -> None:
+        """Resolve with the body up to `stop`."""
+        self._done.set_result(self._copy(stop))
+
+    def _copy(self, stop: int) -> bytes:
+        """Copy the body up to `stop` out of the shared buffer."""
+        with memoryview(self.buffer) as view:
+            return bytes(view[self._body : stop])
+
+
+class HacsBobilRawTransport:
+    """
+    Fetch pages from the controller over plain HTTP/1.0.
+
+    The controller serves small, uncompressed pages, one request per
+    connection, so a full HTTP client is more than is needed. This speaks just
+    that subset on an `asyncio.BufferedProtocol` and keeps its receive buffer
+    between requests. It handles one request at a time; the client's request
+    scheduler already serializes all traffic to a host.
+    """
+
+    def __init__(self, host: str, port: int = 80) -> None:
+        """Initialize the transport."""
+        self._host = host
+        self._port = port
+        authority = host if port == 80 else f"{host}:{port}"  # noqa: PLR2004
+        self._request_tail = f" HTTP/1.0\r\nHost: {authority}\r\n\r\n".encode()
+        self._buffer = bytearray(RAW_BUFFER_SIZE)
+        self.first_byte: float | None = None
+
+    async def async_get(
+        self,
+        path: str,
+        connect_timeout: float,
+        until: Callable[[bytearray, int, int], int | None] | None = None,
+    ) -> bytes:
+        """
+        Request `path` and return the response body.
+
+        `until` is called as the body arrives with the buffer and the offsets
+        of the body received so far; returning an offset ends the response
+        there and closes the connection early. Raises `OSError` for
+        connection failures and `HacsBobilTransportError` for bad responses.
+        """
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[bytes] = loop.create_future()
+        protocol = _ResponseProtocol(self._buffer, done, until)
+        started = monotonic()
+        self.first_byte = None
+        async with async_timeout.timeout(connect_timeout):
+            transport, _ = await loop.create_connection(
+                lambda: protocol, self._host, self._port
+            )
+        try:
+            transport.write(b"GET " + path.encode() + self._request_tail)
+            return await done
+        finally:
+            if done.done():
+                transport.close()
+            else:
+                # Cancelled; stop writing into the shared buffer right away.
+                transport.abort()
+            if protocol.first_byte is not None:
+                self.first_byte = protocol.first_byte - started
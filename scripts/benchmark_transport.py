@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the aiohttp and lightweight HTTP transports against a simulator.
+
+Starts `simulator.py` in a separate process, so its work is not counted, and
+then fetches and parses the page repeatedly with each transport, with and
+without streaming. Wall time and CPU time of this process are reported per
+poll. Pass `--port` to use a simulator (or controller) that is already
+running instead.
+
+Run from the repository root, with the development requirements installed:
+
+    python3 scripts/benchmark_transport.py --polls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components"))
+
+from hacs_bobil.api import HacsBobilApiClient  # noqa: E402
+
+MODES = (
+    ("aiohttp", False, True),
+    ("aiohttp full", False, False),
+    ("raw", True, True),
+    ("raw full", True, False),
+)
+
+
+async def _async_wait_for(host: str, port: int) -> None:
+    """Wait until the simulator accepts connections."""
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            return
+
+
+async def _async_run(
+    client: HacsBobilApiClient, polls: int
+) -> tuple[list[float], float]:
+    """Poll `polls` times; return the wall time of each poll and the CPU time."""
+    latencies = []
+    cpu = time.process_time()
+    for _ in range(polls):
+        started = time.perf_counter()
+        body, complete = await client._fetch_page()  # noqa: SLF001
+        client.parse_page(body, complete=complete)
+        latencies.append(time.perf_counter() - started)
+    return latencies, time.process_time() - cpu
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    await _async_wait_for(args.host, args.port)
+    host = f"{args.host}:{args.port}"
+    # The controller closes the connection after every response, so aiohttp
+    # must not get to reuse connections to the simulator either.
+    connector = aiohttp.TCPConnector(force_close=True)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        print(f"{'transport':<14}{'p50 ms':>9}{'p95 ms':>9}{'cpu us/poll':>13}")
+        for name, raw, streaming in MODES:
+            client = HacsBobilApiClient(
+                host, session, streaming=streaming, raw_transport=raw
+            )
+            # Warm up buffers and caches first.
+            await _async_run(client, min(args.polls, 50))
+            latencies, cpu = await _async_run(client, args.polls)
+            quantiles = statistics.quantiles(latencies, n=20)
+            print(
+                f"{name:<14}{quantiles[9] * 1e3:>9.3f}{quantiles[18] * 1e3:>9.3f}"
+                f"{cpu / args.polls * 1e6:>13.1f}"
+            )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="use an already running server")
+    parser.add_argument("--polls", type=int, default=1000)
+    args = parser.parse_args()
+
+    simulator = None
+    if args.port is None:
+        args.port = 8099
+        simulator = subprocess.Popen(  # noqa: S603
+            [
+                sys.executable,
+                str(ROOT / "scripts" / "simulator.py"),
+                "--host",
+                args.host,
+                "--port",
+                str(args.port),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        asyncio.run(_async_main(args))
+    finally:
+        if simulator is not None:
+            simulator.terminate()
+            simulator.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Run stand-in Bobil controllers for offline load and latency testing.
+
+Each simulated controller serves a page in the same format as `sample.html`,
+implements the `/f1on`...`/f5on` command endpoints with gradual state
+changes, and can inject latency, connection resets, truncated bodies and a
+single-connection limit. Several controllers can run side by side on
+consecutive ports:
+
+    python3 scripts/simulator.py --count 20 --port 8001 --latency 0.2
+
+Point a config entry (or `HacsBobilApiClient`) at `127.0.0.1:8001` and up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+from dataclasses import dataclass, field
+from time import monotonic
+
+from aiohttp import web
+
+PAGE = """<!DOCTYPE html> <html>
+<head><meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=no">
+<meta http-equiv="refresh" content="5"><title>VAN COMMAND</title>
+<style>html{{font-family:Helvetica; display:inline-block; margin:0px auto; text-align:center;}}
+body{{margin-top: 50px;}} h1{{color: #444444; margin: 10px auto 10px;}} h2{{color:#444444; margin-bottom: 10px;}} h3{{color:#FF0000; margin: 10px auto 10px;}}
+.button{{display:block; width:80px; background-color:#f48100; border:none; color:white; padding: 14px 30px; text-decoration:none; font-size:25px; margin: 0px auto 35px; cursor:pointer; border-radius:4px;}}
+.button-on{{background-color:#f48100;}}
+.button-on:active{{background-color:#f48100;}}
+.button-off{{background-color:#26282d;}}
+.button-off:active{{background-color:#26282d;}}
+</style>
+</head>
+<body>
+<h1>BOBIL VANS</h1>
+<h2>HEATING CONTROL</h2>
+<p>SYSTEM NO: {system_number}<h3>{van_heating_status}</h3>
+<p>AIR TEMP: {air_temperature:.2f}&deg;C</p><p>AIR TEMP TARGET: {air_temperature_target:.2f}&deg;C</p><p>WATER TANK TEMP: {water_tank_temperature:.2f}&deg;C</p><p>WATER LEVEL: {water_level:.2f}%</p><p>........ </div>
+</html>
+{buttons}<p>TEMP UP</p><a class="button button-off" href="/f4off">SET</a>
+<p>TEMP DOWN</p><a class="button button-off" href="/f5off">SET</a>
+</body>
+</html>"""  # noqa: E501
+
+BUTTON = (
+    "<p>{label} STATUS: {status}</p>"
+    '<a class="button button-{css}" href="/f{n}{action}">{action_label}</a>\n'
+)
+
+MODES = (
+    (1, "air", "AIR HEATING"),
+    (2, "water", "WATER HEATING"),
+    (3, "combined", "AIR AND WATER HEATING"),
+)
+
+# Seconds the heater reports a transitional status after switching
+STARTING_TIME = 20.0
+COOLING_TIME = 60.0
+# Degrees per second while heating, and heat loss towards ambient
+AIR_HEATING_RATE = 0.05
+WATER_HEATING_RATE = 0.02
+COOLING_RATE = 0.002
+AMBIENT = 5.0
+
+
+@dataclass
+class SimulatedController:
+    """State and fault settings of one simulated controller."""
+
+    system_number: int
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    reflect_delay: float = 1.0
+    reset_rate: float = 0.0
+    truncate_rate: float = 0.0
+    single_connection: bool = False
+    air_temperature: float = AMBIENT
+    air_temperature_target: float = 21.0
+    water_tank_temperature: float = AMBIENT
+    water_level: float = 80.0
+    heating: dict[str, bool] = field(
+        default_factory=lambda: dict.fromkeys(("air", "water", "combined"), False)
+    )
+    requests: int = 0
+    _switched: float = field(default=-COOLING_TIME)
+    _ticked: float = field(default_factory=monotonic)
+    _busy: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def van_heating_status(self) -> str:
+        """Return the status line shown under the system number."""
+        since = monotonic() - self._switched
+        if any(self.heating.values()):
+            return "HEATER STARTING" if since < STARTING_TIME else "HEATER RUNNING"
+        return "HEATER COOLING" if since < COOLING_TIME else "HEATER OFF"
+
+    def render(self) -> bytes:
+        """Render the current page."""
+        self._tick()
+        buttons = "".join(
+            BUTTON.format(
+                label=label,
+                status="ON" if self.heating[mode] else "OFF",
+                css="off" if self.heating[mode] else "on",
+                n=n,
+                action="off" if self.heating[mode] else "on",
+                action_label="OFF" if self.heating[mode] else "ON",
+            )
+            for n, mode, label in MODES
+        )
+        return PAGE.format(
+            system_number=self.system_number,
+            van_heating_status=self.van_heating_status,
+            air_temperature=self.air_temperature,
+            air_temperature_target=self.air_temperature_target,
+            water_tank_temperature=self.water_tank_temperature,
+            water_level=self.water_level,
+            buttons=buttons,
+        ).encode()
+
+    def command(self, n: int, *, on: bool) -> None:
+        """Apply a command after the controller's reflection delay."""
+        loop = asyncio.get_running_loop()
+        if n in (4, 5):
+            step = 1.0 if n == 4 else -1.0  # noqa: PLR2004
+            loop.call_later(self.reflect_delay, self._move_target, step)
+            return
+        mode = MODES[n - 1][1]
+        loop.call_later(self.reflect_delay, self._switch, mode, on)
+
+    def _move_target(self, step: float) -> None:
+        target = self.air_temperature_target + step
+        self.air_temperature_target = min(max(target, 5), 30)
+
+    def _switch(self, mode: str, on: bool) -> None:  # noqa: FBT001
+        if self.heating[mode] != on:
+            self.heating[mode] = on
+            self._switched = monotonic()
+
+    def _tick(self) -> None:
+        """Advance temperatures and water use since the last render."""
+        now = monotonic()
+        elapsed, self._ticked = now - self._ticked, now
+        air = self.heating["air"] or self.heating["combined"]
+        water = self.heating["water"] or self.heating["combined"]
+        if air and self.air_temperature < self.air_temperature_target:
+            self.air_temperature += AIR_HEATING_RATE * elapsed
+        else:
+            self.air_temperature -= (
+                (self.air_temperature - AMBIENT) * COOLING_RATE * elapsed
+            )
+        if water:
+            self.water_tank_temperature = min(
+                self.water_tank_temperature + WATER_HEATING_RATE * elapsed, 60
+            )
+        else:
+            self.water_tank_temperature -= (
+                (self.water_tank_temperature - AMBIENT) * COOLING_RATE * elapsed
+            )
+        self.water_level = max(self.water_level - 0.001 * elapsed, 0)
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Serve one request, injecting the configured faults."""
+        self.requests += 1
+        if self.single_connection and self._busy.locked():
+            request.transport.abort()
+            return web.Response(status=503)
+        async with self._busy if self.single_connection else contextlib.nullcontext():
+            await asyncio.sleep(
+                max(self.latency + random.uniform(-1, 1) * self.latency_jitter, 0)  # noqa: S311
+            )
+            if random.random() < self.reset_rate:  # noqa: S311
+                request.transport.abort()
+                return web.Response(status=503)
+
+            path = request.match_info.get("command")
+            if path:
+                n, action = int(path[1]), path[2:]
+                if 1 <= n <= 5 and action in ("on", "off"):  # noqa: PLR2004
+                    if action == "on" or n <= 3:  # noqa: PLR2004
+                        self.command(n, on=action == "on")
+                    body = b"OK"
+                else:
+                    return web.Response(status=404)
+            else:
+                body = self.render()
+
+            if random.random() < self.truncate_rate:  # noqa: S311
+                response = web.StreamResponse()
+                response.content_length = len(body)
+                response.content_type = "text/html"
+                await response.prepare(request)
+                await response.write(body[: random.randrange(1, len(body))])  # noqa: S311
+                request.transport.close()
+                return response
+            return web.Response(body=body, content_type="text/html")
+
+
+def build_app(controller: SimulatedController) -> web.Application:
+    """Return an aiohttp application serving `controller`."""
+    app = web.Application()
+    app.router.add_get("/", controller.handle)
+    app.router.add_get("/{command:f[0-9][a-z]+}", controller.handle)
+    return app
+
+
+async def async_start(
+    controllers: list[SimulatedController], host: str, port: int
+) -> list[web.AppRunner]:
+    """Serve each controller on consecutive ports starting at `port`."""
+    runners = []
+    for offset, controller in enumerate(controllers):
+        runner = web.AppRunner(build_app(controller), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port + offset).start()
+        runners.append(runner)
+    return runners
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    controllers = [
+        SimulatedController(
+            system_number=1000 + index,
+            latency=args.latency,
+            latency_jitter=args.jitter,
+            reflect_delay=args.reflect_delay,
+            reset_rate=args.reset_rate,
+            truncate_rate=args.truncate_rate,
+            single_connection=args.single_connection,
+        )
+        for index in range(args.count)
+    ]
+    runners = await async_start(controllers, args.host, args.port)
+    print(
+        f"Serving {args.count} controller(s) on "
+        f"{args.host}:{args.port}-{args.port + args.count - 1}"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    """Run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument(
+        "--reflect-delay",
+        type=float,
+        default=1.0,
+        help="seconds before a command shows on the page",
+    )
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--single-connection", action="store_true")
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    main()
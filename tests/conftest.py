@@ -0,0 +1,7 @@
+"""Shared setup for the hacs_bobil tests."""
+
+import sys
+from pathlib import Path
+
+# Import the integration as `hacs_bobil`, like the scripts do.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
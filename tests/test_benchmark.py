@@ -0,0 +1,49 @@
+"""Benchmarks of the controller page parser."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from hacs_bobil.api import HacsBobilApiClient
+from hacs_bobil.fields import page_keys
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SAMPLE = (Path(__file__).resolve().parent.parent / "sample.html").read_bytes()
+# Seconds a single parse may take on average
+PARSE_BUDGET = 0.05
+
+CASES = {
+    "sample": SAMPLE,
+    "heating": SAMPLE.replace(
+        b"AIR HEATING STATUS: OFF", b"AIR HEATING STATUS: ON"
+    ).replace(b"<h3>HEATER COOLING</h3>", b"<h3>HEATER RUNNING</h3>"),
+    # A page missing its trailing status lines forces a scan to the end.
+    "truncated": SAMPLE[: SAMPLE.index(b"<p>AIR HEATING STATUS")],
+    # Firmware with a heavier stylesheet in front of the values.
+    "large_head": SAMPLE.replace(
+        b"</style>", b"a{color:#444444;}\n" * 200 + b"</style>"
+    ),
+    "no_values": b"<html><body><h1>BOBIL VANS</h1></body></html>",
+}
+# Snapshot fields to extract: all of them, or only what a few entities show
+FIELDS = {
+    "all": None,
+    "subset": ("air_temperature", "heating_mode"),
+}
+
+
+@pytest.mark.parametrize("fields", FIELDS.values(), ids=FIELDS.keys())
+@pytest.mark.parametrize("html", CASES.values(), ids=CASES.keys())
+def test_parse(
+    benchmark: BenchmarkFixture, html: bytes, fields: tuple[str, ...] | None
+) -> None:
+    """Parsing a page stays within the budget."""
+    client = HacsBobilApiClient(host="benchmark", session=None)  # type: ignore[arg-type]
+    if fields is not None:
+        client.set_fields(page_keys(fields))
+    benchmark(client._parse_html, html)
+    assert benchmark.stats.stats.mean < PARSE_BUDGET
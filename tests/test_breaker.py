@@ -0,0 +1,165 @@
+"""Tests of the circuit breaker for unreachable controllers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from hacs_bobil import breaker as breaker_module
+from hacs_bobil.breaker import (
+    HacsBobilCircuitBreaker,
+    HacsBobilCircuitBreakerOpenError,
+)
+from hacs_bobil.const import (
+    BREAKER_BACKOFF_MAX,
+    BREAKER_BACKOFF_MIN,
+    BREAKER_THRESHOLD,
+)
+
+
+class _Writer:
+    """Stand-in for the stream writer of a probe connection."""
+
+    def __init__(self, *, error: bool = False) -> None:
+        """Initialize the writer."""
+        self.error = error
+        self.closed = False
+        self.waited = False
+
+    def close(self) -> None:
+        """Record the close."""
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        """Record the wait, failing like a reset connection if asked to."""
+        self.waited = True
+        if self.error:
+            msg = "Connection reset by peer"
+            raise ConnectionResetError(msg)
+
+
+class _Controller:
+    """Patched clock and connection for a breaker under test."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Patch the clock, the jitter and `asyncio.open_connection`."""
+        self.now = 1000.0
+        self.reachable = False
+        self.probes = 0
+        self.writers: list[_Writer] = []
+        monkeypatch.setattr(breaker_module, "monotonic", lambda: self.now)
+        monkeypatch.setattr(breaker_module.random, "uniform", lambda _a, _b: 1.0)
+        monkeypatch.setattr(
+            breaker_module.asyncio, "open_connection", self._open_connection
+        )
+
+    async def _open_connection(self, *_: object) -> tuple[None, _Writer]:
+        """Connect when the controller is reachable."""
+        self.probes += 1
+        if not self.reachable:
+            msg = "No route to host"
+            raise OSError(msg)
+        writer = _Writer(error=len(self.writers) % 2 == 1)
+        self.writers.append(writer)
+        return None, writer
+
+
+def _open(breaker: HacsBobilCircuitBreaker) -> None:
+    """Record failures up to the threshold."""
+    for _ in range(BREAKER_THRESHOLD):
+        breaker.record_failure()
+
+
+def _before_request(breaker: HacsBobilCircuitBreaker) -> None:
+    """Run the pre-request check."""
+    asyncio.run(breaker.async_before_request())
+
+
+@pytest.fixture
+def controller(monkeypatch: pytest.MonkeyPatch) -> _Controller:
+    """Return the patched controller."""
+    return _Controller(monkeypatch)
+
+
+def test_threshold(controller: _Controller) -> None:
+    """The breaker opens at the threshold and then fails without a probe."""
+    breaker = HacsBobilCircuitBreaker("192.168.4.1", 80)
+    for _ in range(BREAKER_THRESHOLD - 1):
+        breaker.record_failure()
+        _before_request(breaker)
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(HacsBobilCircuitBreakerOpenError, match="next attempt"):
+        _before_request(breaker)
+    assert controller.probes == 0
+
+
+def test_success_resets_count(controller: _Controller) -> None:
+    """A success between failures restarts the count."""
+    breaker = HacsBobilCircuitBreaker("192.168.4.1", 80)
+    for _ in range(BREAKER_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+    _before_request(breaker)
+    assert controller.probes == 0
+
+
+def test_backoff(controller: _Controller) -> None:
+    """Each failed probe doubles the backoff, up to the maximum."""
+    breaker = HacsBobilCircuitBreaker("192.168.4.1", 80)
+    _open(breaker)
+    backoff = BREAKER_BACKOFF_MIN
+    probes = 0
+    while backoff < BREAKER_BACKOFF_MAX:
+        controller.now += backoff - 1
+        with pytest.raises(HacsBobilCircuitBreakerOpenError, match="next attempt"):
+            _before_request(breaker)
+        assert controller.probes == probes
+        controller.now += 1
+        with pytest.raises(HacsBobilCircuitBreakerOpenError, match="still"):
+            _before_request(breaker)
+        probes += 1
+        assert controller.probes == probes
+        backoff = min(backoff * 2, BREAKER_BACKOFF_MAX)
+    controller.now += BREAKER_BACKOFF_MAX - 1
+    with pytest.raises(HacsBobilCircuitBreakerOpenError, match="next attempt"):
+        _before_request(breaker)
+
+
+def test_probe_lets_request_through(controller: _Controller) -> None:
+    """A probe that connects lets the request through and closes its socket."""
+    breaker = HacsBobilCircuitBreaker("192.168.4.1", 80)
+    _open(breaker)
+    controller.reachable = True
+    controller.now += BREAKER_BACKOFF_MIN
+    _before_request(breaker)
+    assert controller.probes == 1
+    assert controller.writers[0].closed
+    assert controller.writers[0].waited
+
+    # The request itself fails: the breaker stays open and backs off further.
+    breaker.record_failure()
+    assert breaker.is_open
+    controller.now += BREAKER_BACKOFF_MIN
+    with pytest.raises(HacsBobilCircuitBreakerOpenError, match="next attempt"):
+        _before_request(breaker)
+    controller.now += BREAKER_BACKOFF_MIN
+    # An error while closing the probe connection does not fail the request.
+    _before_request(breaker)
+    assert controller.writers[1].waited
+
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.failures == 0
+    _before_request(breaker)
+    assert controller.probes == 2
+
+    # After closing, the backoff starts from the minimum again.
+    controller.reachable = False
+    _open(breaker)
+    controller.now += BREAKER_BACKOFF_MIN
+    with pytest.raises(HacsBobilCircuitBreakerOpenError, match="still"):
+        _before_request(breaker)
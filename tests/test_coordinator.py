@@ -0,0 +1,115 @@
+"""Tests of the command planning in the coordinator."""
+
+from __future__ import annotations
+
+import pytest
+from hacs_bobil.const import (
+    ENDPOINT_AIR_OFF,
+    ENDPOINT_AIR_ON,
+    ENDPOINT_COMBINED_OFF,
+    ENDPOINT_COMBINED_ON,
+    ENDPOINT_TEMP_DOWN,
+    ENDPOINT_TEMP_UP,
+    ENDPOINT_WATER_OFF,
+    ENDPOINT_WATER_ON,
+)
+from hacs_bobil.coordinator import plan_commands
+from hacs_bobil.data import HacsBobilSnapshot
+from homeassistant.exceptions import HomeAssistantError
+
+AIR_ON = HacsBobilSnapshot(
+    air_temperature_target=20,
+    air_heating_status=True,
+    water_heating_status=False,
+    combined_heating_status=False,
+)
+ALL_OFF = HacsBobilSnapshot(
+    air_temperature_target=20,
+    air_heating_status=False,
+    water_heating_status=False,
+    combined_heating_status=False,
+)
+
+
+@pytest.mark.parametrize(
+    ("current", "statuses", "temperature", "expected"),
+    [
+        pytest.param(
+            AIR_ON,
+            {"air_heating_status": True, "water_heating_status": False},
+            20,
+            [],
+            id="nothing differs",
+        ),
+        pytest.param(AIR_ON, {}, None, [], id="nothing asked"),
+        pytest.param(
+            AIR_ON,
+            {"water_heating_status": True, "air_heating_status": False},
+            None,
+            [ENDPOINT_AIR_OFF, ENDPOINT_WATER_ON],
+            id="off before on",
+        ),
+        pytest.param(
+            AIR_ON,
+            {
+                "combined_heating_status": True,
+                "water_heating_status": False,
+                "air_heating_status": False,
+            },
+            None,
+            [ENDPOINT_AIR_OFF, ENDPOINT_COMBINED_ON],
+            id="only differing modes",
+        ),
+        pytest.param(
+            ALL_OFF,
+            {"combined_heating_status": True},
+            None,
+            [ENDPOINT_COMBINED_ON],
+            id="omitted modes left alone",
+        ),
+        pytest.param(
+            HacsBobilSnapshot(
+                air_temperature_target=20,
+                water_heating_status=True,
+                combined_heating_status=True,
+            ),
+            {"combined_heating_status": False, "water_heating_status": False},
+            None,
+            [ENDPOINT_COMBINED_OFF, ENDPOINT_WATER_OFF],
+            id="several off",
+        ),
+        pytest.param(ALL_OFF, {}, 23, [ENDPOINT_TEMP_UP] * 3, id="fewest up presses"),
+        pytest.param(
+            ALL_OFF, {}, 18, [ENDPOINT_TEMP_DOWN] * 2, id="fewest down presses"
+        ),
+        pytest.param(ALL_OFF, {}, 20.4, [], id="target within half a step"),
+        pytest.param(
+            AIR_ON,
+            {"air_heating_status": False, "water_heating_status": True},
+            21,
+            [ENDPOINT_AIR_OFF, ENDPOINT_WATER_ON, ENDPOINT_TEMP_UP],
+            id="temperature last",
+        ),
+        pytest.param(
+            ALL_OFF,
+            {"air_heating_status": True},
+            None,
+            [ENDPOINT_AIR_ON],
+            id="single on",
+        ),
+    ],
+)
+def test_plan_commands(
+    current: HacsBobilSnapshot,
+    statuses: dict[str, bool],
+    temperature: float | None,
+    expected: list[str],
+) -> None:
+    """The plan switches only what differs, off first, then moves the target."""
+    assert plan_commands(current, statuses, temperature) == expected
+
+
+def test_unknown_target() -> None:
+    """A temperature cannot be planned before the target is known."""
+    with pytest.raises(HomeAssistantError):
+        plan_commands(HacsBobilSnapshot(), {}, 21)
@@ -0,0 +1,86 @@
+"""Tests of the rolling history windows against a brute-force calculation."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from hacs_bobil.const import HISTORY_MIN_SPAN
+from hacs_bobil.data import HacsBobilSnapshot
+from hacs_bobil.history import HacsBobilHistory, HacsBobilRollingWindow
+
+
+def _slope(samples: list[tuple[float, float]]) -> float | None:
+    """Return the least-squares slope of `samples`, as the window reports it."""
+    if len(samples) < 2 or samples[-1][0] - samples[0][0] < HISTORY_MIN_SPAN:
+        return None
+    mean_t = sum(t for t, _ in samples) / len(samples)
+    mean_v = sum(v for _, v in samples) / len(samples)
+    covariance = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    variance = sum((t - mean_t) ** 2 for t, _ in samples)
+    return covariance / variance
+
+
+@pytest.mark.parametrize(
+    ("capacity", "window", "start"),
+    [
+        # Samples drop out because the buffer is full.
+        (16, 10_000, 0),
+        # Samples drop out because they are too old.
+        (64, 120, 0),
+        # Both, far from the origin of the monotonic clock.
+        (16, 90, 1e9),
+    ],
+)
+def test_matches_brute_force(capacity: int, window: float, start: float) -> None:
+    """Slope, minimum and maximum match a recalculation over the kept samples."""
+    rng = random.Random(capacity)  # noqa: S311
+    rolling = HacsBobilRollingWindow(capacity, window)
+    kept: list[tuple[float, float]] = []
+    timestamp = start
+    # Many times round the buffer, so the ring wraps and the origin moves.
+    for _ in range(capacity * 20):
+        timestamp += rng.uniform(1, 15)
+        value = round(rng.uniform(-5, 30), 1)
+        rolling.add(timestamp, value)
+        kept.append((timestamp, value))
+        kept = [(t, v) for t, v in kept[-capacity:] if timestamp - t <= window]
+
+        assert len(rolling) == len(kept)
+        assert rolling.span == pytest.approx(kept[-1][0] - kept[0][0])
+        assert rolling.minimum == min(v for _, v in kept)
+        assert rolling.maximum == max(v for _, v in kept)
+        expected = _slope(kept)
+        if expected is None:
+            assert rolling.slope is None
+        else:
+            assert rolling.slope == pytest.approx(expected, rel=1e-6, abs=1e-9)
+
+
+def test_empty() -> None:
+    """An empty window reports nothing."""
+    rolling = HacsBobilRollingWindow(4, 60)
+    assert len(rolling) == 0
+    assert rolling.span == 0
+    assert rolling.slope is None
+    assert rolling.minimum is None
+    assert rolling.maximum is None
+
+
+def test_constant_time() -> None:
+    """Samples that all share a timestamp have no slope."""
+    rolling = HacsBobilRollingWindow(4, 60)
+    for value in (1.0, 2.0, 3.0):
+        rolling.add(100, value)
+    assert rolling.slope is None
+    assert (rolling.minimum, rolling.maximum) == (1.0, 3.0)
+
+
+def test_history_skips_unknown_readings() -> None:
+    """Only the readings a snapshot has are added."""
+    history = HacsBobilHistory(("air_temperature", "water_level"))
+    history.add(0, HacsBobilSnapshot(air_temperature=20.0))
+    history.add(HISTORY_MIN_SPAN, HacsBobilSnapshot(air_temperature=21.0))
+    assert len(history["air_temperature"]) == 2
+    assert len(history["water_level"]) == 0
+    assert history["air_temperature"].slope == pytest.approx(1 / HISTORY_MIN_SPAN)
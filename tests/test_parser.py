@@ -0,0 +1,152 @@
+"""Tests of the controller page parser against the original per-field regexes."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+from hacs_bobil.api import HacsBobilApiClient, _PageScanner
+from hacs_bobil.fields import PAGE_KEYS, page_keys
+
+SAMPLE = (Path(__file__).resolve().parent.parent / "sample.html").read_bytes()
+
+# The parser as it was before the single-pass pattern: one search per field.
+_BASELINE = (
+    ("air_temperature", r"AIR TEMP:\s*([-\d.]+)&deg;C", float),
+    ("air_temperature_target", r"AIR TEMP TARGET:\s*([-\d.]+)&deg;C", float),
+    ("water_tank_temperature", r"WATER TANK TEMP:\s*([-\d.]+)&deg;C", float),
+    ("water_level", r"WATER LEVEL:\s*([-\d.]+)%", float),
+    ("system_number", r"SYSTEM NO:\s*(\d+)", str),
+    ("air_heating_status", r"AIR HEATING STATUS:\s*(ON|OFF)", "ON".__eq__),
+    ("water_heating_status", r"WATER HEATING STATUS:\s*(ON|OFF)", "ON".__eq__),
+    (
+        "combined_heating_status",
+        r"AIR AND WATER HEATING STATUS:\s*(ON|OFF)",
+        "ON".__eq__,
+    ),
+    ("van_heating_status", r"<h3>(.*?)</h3>", str.strip),
+)
+
+
+def _baseline(html: bytes) -> dict[str, Any]:
+    """Parse `html` the way the original parser did."""
+    text = html.decode()
+    found = {}
+    for key, pattern, converter in _BASELINE:
+        if match := re.search(pattern, text):
+            found[key] = converter(match.group(1))
+    return found
+
+
+def _parsed(client: HacsBobilApiClient, html: bytes, **kwargs: Any) -> dict[str, Any]:
+    """Return the page fields `client` extracts from `html`."""
+    snapshot = client._parse_html(html, **kwargs)
+    return {
+        key: value for key in PAGE_KEYS if (value := getattr(snapshot, key)) is not None
+    }
+
+
+def _pages() -> dict[str, bytes]:
+    """Return the sample page, variants of it and cuts after every tag."""
+    pages = {
+        "sample": SAMPLE,
+        "heating": SAMPLE.replace(
+            b"AIR HEATING STATUS: OFF", b"AIR HEATING STATUS: ON"
+        ).replace(b"<h3>HEATER COOLING</h3>", b"<h3>HEATER RUNNING</h3>"),
+        "large_head": SAMPLE.replace(
+            b"</style>", b"a{color:#444444;}\n" * 200 + b"</style>"
+        ),
+        "no_values": b"<html><body><h1>BOBIL VANS</h1></body></html>",
+    }
+    # Unlike the original, a value running to the very end of the body is
+    # not trusted; see test_cut_off_value_is_dropped.
+    for match in re.finditer(rb">", SAMPLE):
+        pages[f"cut_at_{match.end()}"] = SAMPLE[: match.end()]
+    return pages
+
+
+@pytest.fixture
+def client() -> HacsBobilApiClient:
+    """Return a client that is only used for parsing."""
+    return HacsBobilApiClient(host="test", session=None)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("html", _pages().values(), ids=_pages().keys())
+def test_matches_baseline(client: HacsBobilApiClient, html: bytes) -> None:
+    """Every field matches what the original regexes found."""
+    assert _parsed(client, html) == _baseline(html)
+
+
+@pytest.mark.parametrize("html", _pages().values(), ids=_pages().keys())
+def test_subset_matches_baseline(client: HacsBobilApiClient, html: bytes) -> None:
+    """A parser for some fields finds those fields and nothing else."""
+    keys = page_keys(("air_temperature", "water_level", "heating_mode"))
+    client.set_fields(keys)
+    expected = {key: value for key, value in _baseline(html).items() if key in keys}
+    assert _parsed(client, html) == expected
+
+
+@pytest.mark.parametrize(
+    ("marker", "key"),
+    [
+        (b"SYSTEM NO: 10", "system_number"),
+        (b"WATER LEVEL: 0", "water_level"),
+        (b"<h3>HEATER COO", "van_heating_status"),
+    ],
+)
+def test_cut_off_value_is_dropped(
+    client: HacsBobilApiClient, marker: bytes, key: str
+) -> None:
+    """A value cut off by the end of a truncated body is left unset."""
+    html = SAMPLE[: SAMPLE.index(marker) + len(marker)]
+    fields = _parsed(client, html, cut_off=True)
+    assert key not in fields
+    expected = _baseline(html)
+    expected.pop(key, None)
+    assert fields == expected
+
+
+def test_cut_off_at_tag_keeps_complete_values(client: HacsBobilApiClient) -> None:
+    """A body cut off between fields still yields every field before the cut."""
+    html = SAMPLE[: SAMPLE.index(b"<p>AIR HEATING STATUS")]
+    assert _parsed(client, html, cut_off=True) == _baseline(html)
+
+
+def test_shared_fetch_keeps_cut_off_flag(
+    client: HacsBobilApiClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Every caller sharing a fetch of a cut-off body learns that it was cut off."""
+    html = SAMPLE[: SAMPLE.index(b"WATER LEVEL: 0") + len(b"WATER LEVEL: 0")]
+
+    async def fetch_page() -> tuple[bytes, bool]:
+        await asyncio.sleep(0)
+        return html, False
+
+    async def run() -> list[tuple[bytes, bool]]:
+        return await asyncio.gather(*(client.async_get_page() for _ in range(3)))
+
+    monkeypatch.setattr(client, "_fetch_page", fetch_page)
+    pages = asyncio.run(run())
+    assert pages == [(html, False)] * 3
+    for body, complete in pages:
+        assert client.parse_page(body, complete=complete).water_level is None
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64, 512])
+def test_streaming_stops_after_last_field(
+    client: HacsBobilApiClient, chunk: int
+) -> None:
+    """The scanner ends the body right after the last field, whatever the chunks."""
+    scanner = _PageScanner(client._parser)
+    buffer = bytearray()
+    end = None
+    for start in range(0, len(SAMPLE), chunk):
+        buffer += SAMPLE[start : start + chunk]
+        if (end := scanner(buffer, 0, len(buffer))) is not None:
+            break
+    assert end is not None
+    assert end < len(SAMPLE)
+    assert _parsed(client, bytes(buffer[:end])) == _baseline(SAMPLE)
@@ -0,0 +1,57 @@
+"""Tests of the heater runtime counters."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from hacs_bobil.data import HacsBobilSnapshot
+from hacs_bobil.runtime import HacsBobilRuntime
+
+START = datetime(2026, 1, 1, 12, tzinfo=UTC)
+ON = HacsBobilSnapshot(air_heating_status=True, water_heating_status=False)
+OFF = HacsBobilSnapshot(air_heating_status=False, water_heating_status=False)
+MAX_GAP = 200
+
+
+def _feed(runtime: HacsBobilRuntime, *samples: tuple[float, HacsBobilSnapshot]) -> None:
+    """Add snapshots at the given seconds after START."""
+    for seconds, snapshot in samples:
+        runtime.add(START + timedelta(seconds=seconds), snapshot, MAX_GAP)
+
+
+def test_on_time_and_cycles() -> None:
+    """Time after an on snapshot is on-time, and off to on is a cycle."""
+    runtime = HacsBobilRuntime()
+    _feed(runtime, (0, OFF), (60, ON), (120, ON), (180, OFF), (240, ON))
+    assert runtime.total["air_heating_status"] == 120
+    assert runtime.cycles["air_heating_status"] == 2
+    assert runtime.total["water_heating_status"] == 0
+    assert runtime.duty_cycle_today("air_heating_status") == 50.0
+
+
+def test_long_gap_is_not_credited() -> None:
+    """A gap longer than the allowed one credits neither on nor observed time."""
+    runtime = HacsBobilRuntime()
+    _feed(runtime, (0, ON), (100, ON), (3100, ON))
+    assert runtime.total["air_heating_status"] == 100
+    assert runtime.today_seen == 100
+
+
+def test_interrupt_skips_the_outage() -> None:
+    """Nothing is credited across a failed poll."""
+    runtime = HacsBobilRuntime()
+    _feed(runtime, (0, ON), (100, ON))
+    runtime.interrupt()
+    _feed(runtime, (150, ON), (200, ON))
+    assert runtime.total["air_heating_status"] == 150
+
+
+def test_restart_is_not_credited() -> None:
+    """Counters survive a save and load, but the downtime is not counted."""
+    runtime = HacsBobilRuntime()
+    _feed(runtime, (0, OFF), (100, ON), (150, ON))
+    restored = HacsBobilRuntime()
+    restored.load(runtime.as_dict())
+    _feed(restored, (190, ON), (250, ON))
+    assert restored.total["air_heating_status"] == 110
+    assert restored.cycles["air_heating_status"] == 1
@@ -0,0 +1,202 @@
+"""Tests of the per-host request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from hacs_bobil import scheduler as scheduler_module
+from hacs_bobil.scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    HacsBobilRequestScheduler,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# High enough that the token bucket never holds a request back
+UNLIMITED = 1000.0
+
+
+def test_command_preempts_running_poll() -> None:
+    """A command cancels the poll in flight, which runs again after it."""
+    log: list[str] = []
+
+    async def run() -> None:
+        scheduler = HacsBobilRequestScheduler(rate=UNLIMITED, burst=10)
+        started = asyncio.Event()
+
+        async def poll() -> str:
+            log.append("poll")
+            started.set()
+            await asyncio.sleep(0.05)
+            log.append("poll done")
+            return "page"
+
+        async def command() -> None:
+            log.append("command")
+
+        polled = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, poll))
+        await started.wait()
+        await scheduler.async_run(PRIORITY_COMMAND, command)
+        assert await polled == "page"
+        assert scheduler.preemptions == 1
+        assert scheduler.queue_depth == 0
+
+    asyncio.run(run())
+    assert log == ["poll", "command", "poll", "poll done"]
+
+
+def test_queued_commands_run_before_queued_polls() -> None:
+    """Waiting requests are served by priority, then in arrival order."""
+    log: list[str] = []
+
+    async def run() -> None:
+        scheduler = HacsBobilRequestScheduler(rate=UNLIMITED, burst=10)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            await release.wait()
+
+        def request(name: str) -> Callable[[], Awaitable[None]]:
+            async def _request() -> None:
+                log.append(name)
+
+            return _request
+
+        holder = asyncio.ensure_future(scheduler.async_run(PRIORITY_COMMAND, hold))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.ensure_future(scheduler.async_run(priority, request(name)))
+            for priority, name in (
+                (PRIORITY_POLL, "poll 1"),
+                (PRIORITY_COMMAND, "command 1"),
+                (PRIORITY_POLL, "poll 2"),
+                (PRIORITY_COMMAND, "command 2"),
+            )
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *queued)
+
+    asyncio.run(run())
+    assert log == ["command 1", "command 2", "poll 1", "poll 2"]
+
+
+def test_cancelled_waiter_leaves_queue_consistent() -> None:
+    """A request cancelled while queued is skipped and frees nothing twice."""
+    log: list[str] = []
+
+    async def run() -> None:
+        scheduler = HacsBobilRequestScheduler(rate=UNLIMITED, burst=10)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            await release.wait()
+
+        async def request() -> None:
+            log.append("ran")
+
+        holder = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, hold))
+        await asyncio.sleep(0)
+        cancelled = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, request))
+        waiting = asyncio.ensure_future(scheduler.async_run(PRIORITY_POLL, request))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 2
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+        release.set()
+        await asyncio.gather(holder, waiting)
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.queue_depth == 0
+        # The connection is free again: a new request runs straight away.
+        await asyncio.wait_for(scheduler.async_run(PRIORITY_POLL, request), 1)
+
+    asyncio.run(run())
+    assert log == ["ran", "ran"]
+
+
+def test_single_flight_shares_one_fetch() -> None:
+    """Concurrent callers share a fetch; a fresh result is reused until invalidated."""
+    calls = 0
+
+    async def run() -> None:
+        nonlocal calls
+        scheduler = HacsBobilRequestScheduler()
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(scheduler.async_single_flight(fetch) for _ in range(5))
+        )
+        assert results == [1] * 5
+        assert await scheduler.async_single_flight(fetch, max_age=60) == 1
+        assert await scheduler.async_single_flight(fetch, max_age=0) == 2
+        scheduler.invalidate()
+        assert await scheduler.async_single_flight(fetch, max_age=60) == 3
+
+    asyncio.run(run())
+    assert calls == 3
+
+
+def test_single_flight_survives_one_caller_cancelling() -> None:
+    """A caller giving up does not cancel the fetch for the others."""
+
+    async def run() -> None:
+        scheduler = HacsBobilRequestScheduler()
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.01)
+            return "page"
+
+        first = asyncio.ensure_future(scheduler.async_single_flight(fetch))
+        second = asyncio.ensure_future(scheduler.async_single_flight(fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "page"
+
+    asyncio.run(run())
+
+
+def test_token_bucket_refill(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A burst uses up the bucket, which refills at the configured rate."""
+    now = 1000.0
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        nonlocal now
+        sleeps.append(delay)
+        now += delay
+
+    monkeypatch.setattr(scheduler_module, "monotonic", lambda: now)
+    monkeypatch.setattr(scheduler_module.asyncio, "sleep", fake_sleep)
+
+    async def request() -> None:
+        pass
+
+    async def run() -> None:
+        nonlocal now
+        scheduler = HacsBobilRequestScheduler(rate=2, burst=2)
+        for _ in range(2):
+            await scheduler.async_run(PRIORITY_POLL, request)
+        assert sleeps == []
+        # The bucket is empty; the next request waits for one token.
+        await scheduler.async_run(PRIORITY_POLL, request)
+        assert sleeps == [pytest.approx(0.5)]
+        # Long after, the bucket is full again but holds no more than the burst.
+        now += 10
+        for _ in range(2):
+            await scheduler.async_run(PRIORITY_POLL, request)
+        assert len(sleeps) == 1
+        await scheduler.async_run(PRIORITY_POLL, request)
+        assert len(sleeps) == 2
+
+    asyncio.run(run())
@@ -0,0 +1,86 @@
+"""Tests of the long-term statistics aggregated in memory."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from hacs_bobil import statistics as statistics_module
+from hacs_bobil.const import DOMAIN
+from hacs_bobil.data import HacsBobilSnapshot
+from hacs_bobil.statistics import HacsBobilStatistics
+
+HOUR = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def imported(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, list[Any]]]:
+    """Capture the statistics handed to the recorder."""
+    calls: list[tuple[Any, list[Any]]] = []
+    monkeypatch.setattr(
+        statistics_module,
+        "async_add_external_statistics",
+        lambda _hass, metadata, statistics: calls.append((metadata, statistics)),
+    )
+    return calls
+
+
+def _statistics(*components: str) -> HacsBobilStatistics:
+    """Return an aggregator for an entry, with the given components loaded."""
+    hass = SimpleNamespace(config=SimpleNamespace(components=set(components)))
+    entry = SimpleNamespace(entry_id="ABC123", title="Van")
+    return HacsBobilStatistics(hass, entry)  # type: ignore[arg-type]
+
+
+def _add(statistics: HacsBobilStatistics, minutes: float, **readings: float) -> None:
+    """Add readings taken `minutes` after HOUR."""
+    statistics.add(HOUR + timedelta(minutes=minutes), HacsBobilSnapshot(**readings))
+
+
+def test_hour_boundary(imported: list[tuple[Any, list[Any]]]) -> None:
+    """An hour is imported with its mean, minimum and maximum once it is over."""
+    statistics = _statistics("recorder")
+    # Two 5-minute periods: a mean of 20 and a mean of 26.
+    _add(statistics, 1, air_temperature=18.0, water_level=50.0)
+    _add(statistics, 2, air_temperature=22.0)
+    _add(statistics, 57, air_temperature=26.0, water_level=40.0)
+    assert not imported
+
+    # The first reading of the next hour closes this one.
+    _add(statistics, 61, air_temperature=30.0, water_level=30.0)
+    by_id = {metadata["statistic_id"]: (metadata, data) for metadata, data in imported}
+    assert set(by_id) == {
+        f"{DOMAIN}:abc123_air_temperature",
+        f"{DOMAIN}:abc123_water_level",
+    }
+    metadata, [data] = by_id[f"{DOMAIN}:abc123_air_temperature"]
+    assert metadata["name"] == "Van Air Temperature"
+    assert metadata["unit_of_measurement"] == "°C"
+    assert data["start"] == HOUR
+    # Every period weighs the same, however many readings it has.
+    assert data["mean"] == pytest.approx(23.0)
+    assert (data["min"], data["max"]) == (18.0, 26.0)
+    _, [data] = by_id[f"{DOMAIN}:abc123_water_level"]
+    assert (data["mean"], data["min"], data["max"]) == (45.0, 40.0, 50.0)
+
+    # The next hour only holds its own readings.
+    imported.clear()
+    _add(statistics, 125, air_temperature=10.0)
+    [(metadata, [data]), *_] = imported
+    assert metadata["statistic_id"] == f"{DOMAIN}:abc123_air_temperature"
+    assert data["start"] == HOUR + timedelta(hours=1)
+    assert (data["mean"], data["min"], data["max"]) == (30.0, 30.0, 30.0)
+
+
+def test_without_recorder(imported: list[tuple[Any, list[Any]]]) -> None:
+    """Without the recorder a finished hour is dropped."""
+    statistics = _statistics()
+    _add(statistics, 1, air_temperature=18.0)
+    _add(statistics, 61, air_temperature=20.0)
+    statistics._hass.config.components.add("recorder")
+    _add(statistics, 121, air_temperature=22.0)
+    [(_, [data])] = imported
+    assert data["start"] == HOUR + timedelta(hours=1)
+    assert data["mean"] == 20.0
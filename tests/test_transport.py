@@ -0,0 +1,131 @@
+"""Tests of the lightweight HTTP/1.0 transport against a local server."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from hacs_bobil.transport import (
+    HacsBobilRawTransport,
+    HacsBobilTransportError,
+    HacsBobilTruncatedBodyError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+BODY = b"<html><body><p>AIR TEMP: 21.5&deg;C</p></body></html>"
+
+
+async def _async_get(
+    response: bytes, until: Callable[[bytearray, int, int], int | None] | None = None
+) -> bytes:
+    """Serve `response` once on a local port and fetch it with the transport."""
+    requests: list[bytes] = []
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(response)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        # A small buffer makes the transport grow it while receiving.
+        transport = HacsBobilRawTransport("127.0.0.1", port)
+        transport._buffer = bytearray(16)
+        body = await transport.async_get("/", 5, until)
+    finally:
+        server.close()
+        await server.wait_closed()
+    assert requests == [f"GET / HTTP/1.0\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode()]
+    return body
+
+
+def _run(coroutine: Awaitable[bytes]) -> bytes:
+    """Run `coroutine` in a fresh event loop."""
+    return asyncio.run(coroutine)
+
+
+def test_body() -> None:
+    """The body up to Content-Length is returned."""
+    response = (
+        b"HTTP/1.0 200 OK\r\nContent-Length: %d\r\n\r\n" % len(BODY) + BODY + b"junk"
+    )
+    assert _run(_async_get(response)) == BODY
+
+
+def test_missing_content_length() -> None:
+    """Without Content-Length the body runs until the server closes."""
+    response = b"HTTP/1.0 200 OK\r\nContent-Type: text/html\r\n\r\n" + BODY
+    assert _run(_async_get(response)) == BODY
+
+
+def test_truncated_body() -> None:
+    """A body shorter than Content-Length raises with what was received."""
+    response = b"HTTP/1.0 200 OK\r\nContent-Length: 1000\r\n\r\n" + BODY
+    with pytest.raises(HacsBobilTruncatedBodyError) as raised:
+        _run(_async_get(response))
+    assert raised.value.body == BODY
+
+
+def test_early_stop() -> None:
+    """`until` ends the body where it says."""
+    response = b"HTTP/1.0 200 OK\r\n\r\n" + BODY
+    end = BODY.index(b"</p>")
+
+    def until(buffer: bytearray, start: int, stop: int) -> int | None:
+        found = buffer.find(b"</p>", start, stop)
+        return None if found < 0 else found
+
+    assert _run(_async_get(response, until)) == BODY[:end]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        b"HTTP/1.0 404 Not Found\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 500 Internal Server Error\r\n\r\n",
+    ],
+)
+def test_error_status(response: bytes) -> None:
+    """A 4xx or 5xx status raises with the status and reason."""
+    status = response.split(b" ", 2)[1].decode()
+    with pytest.raises(HacsBobilTransportError, match=status):
+        _run(_async_get(response))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        b"garbage\r\n\r\n",
+        b"HTTP/1.0 200 OK\r\nContent-Length: many\r\n\r\n",
+        b"HTTP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n",
+        b"HTTP/1.0 200 OK\r\n",
+    ],
+    ids=["status line", "content length", "chunked", "no headers end"],
+)
+def test_malformed_response(response: bytes) -> None:
+    """Responses the transport cannot handle raise a transport error."""
+    with pytest.raises(HacsBobilTransportError):
+        _run(_async_get(response))
+
+
+def test_connect_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A connection that is not established in time times out."""
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+
+        async def never_connect(*_: object, **__: object) -> None:
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(loop, "create_connection", never_connect)
+        with pytest.raises(TimeoutError):
+            await HacsBobilRawTransport("127.0.0.1", 9).async_get("/", 0.01)
+
+    asyncio.run(run())